@@ -1,8 +1,15 @@
+import functools
+import heapq
+import itertools
+import os
 import threading
 import time
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
+import cloudpickle
 
 from ..config import FURU_CONFIG
 from ..storage import StateManager
@@ -32,6 +39,38 @@ SubmititExecutor = Any
 SubmititJob = Any
 
 
+# Exact scheduler states, checked before the substring fallbacks below.
+_EXACT_SCHEDULER_STATES: dict[str, str] = {
+    "COMPLETED": "success",
+    "PREEMPTED": "preempted",
+    "TIMEOUT": "preempted",
+    "NODE_FAIL": "preempted",
+    "REQUEUED": "preempted",
+    "REQUEUE_HOLD": "preempted",
+    "FAILED": "failed",
+    "BOOT_FAIL": "failed",
+}
+
+
+def _set_job_id(job_id: str, state: _FuruState) -> None:
+    # Not keyed on attempt id: the queued attempt is replaced by a running one
+    # before the job id is usually known.
+    attempt = state.attempt
+    if attempt is None:
+        return
+    if attempt.backend != "submitit":
+        return
+    if (
+        attempt.status not in {"queued", "running"}
+        and attempt.status not in StateManager.TERMINAL_STATUSES
+    ):
+        return
+    existing = attempt.scheduler.get("job_id")
+    if existing == job_id:
+        return
+    attempt.scheduler["job_id"] = job_id
+
+
 class SubmititAdapter:
     """Adapter for working with submitit executors."""
 
@@ -61,36 +100,37 @@ class SubmititAdapter:
     def is_done(self, job: SubmititJob) -> bool:
         """Check if job is done."""
         done_fn = getattr(job, "done", None)
-        if done_fn and callable(done_fn):
-            return done_fn()
-        return False
+        return callable(done_fn) and bool(done_fn())
 
     def get_state(self, job: SubmititJob) -> str | None:
         """Get job state from scheduler."""
-        state_fn = getattr(job, "state", None)
-        if state_fn and callable(state_fn):
-            return state_fn()
-        return None
+        # submitit exposes `state` as a property; other job handles use a method.
+        state = getattr(job, "state", None)
+        if callable(state):
+            state = state()
+        return state if isinstance(state, str) else None
 
     def pickle_job(self, job: SubmititJob, directory: Path) -> None:
         """Pickle job handle to file."""
-        import cloudpickle as pickle
-
         job_path = StateManager.get_internal_dir(directory) / self.JOB_PICKLE
         job_path.parent.mkdir(parents=True, exist_ok=True)
-        with job_path.open("wb") as f:
-            pickle.dump(job, f)
+        # Write then rename so `load_job` never sees a truncated pickle.
+        tmp_path = job_path.with_name(f"{job_path.name}.tmp-{uuid.uuid4().hex}")
+        with tmp_path.open("wb") as f:
+            cloudpickle.dump(job, f)
+        os.replace(tmp_path, job_path)
 
     def load_job(self, directory: Path) -> SubmititJob | None:
         """Load job handle from pickle file."""
-        job_path = StateManager.get_internal_dir(directory) / self.JOB_PICKLE
-        if not job_path.is_file():
+        # Joined as a string: building Path objects costs more than the stat itself.
+        job_path = os.path.join(directory, StateManager.INTERNAL_DIR, self.JOB_PICKLE)
+        if not os.path.isfile(job_path):
             return None
 
-        import cloudpickle as pickle
-
-        with job_path.open("rb") as f:
-            return pickle.load(f)
+        # Unpickle on every load: submitit re-registers the job with its watcher on
+        # unpickling, which makes the next state read query the scheduler afresh.
+        with open(job_path, "rb") as f:
+            return cloudpickle.load(f)
 
     def watch_job_id(
         self,
@@ -100,51 +140,46 @@ class SubmititAdapter:
         attempt_id: str,
         callback: Callable[[str], None] | None = None,
     ) -> None:
-        """Watch for job ID in background thread and update state."""
-
-        def watcher():
-            _ = attempt_id  # intentionally unused; queued->running attempt swap is expected
-            while True:
-                job_id = self.get_job_id(job)
-                if job_id:
-
-                    def mutate(state: _FuruState) -> None:
-                        attempt = state.attempt
-                        if attempt is None:
-                            return
-                        if attempt.backend != "submitit":
-                            return
-                        if (
-                            attempt.status not in {"queued", "running"}
-                            and attempt.status not in StateManager.TERMINAL_STATUSES
-                        ):
-                            return
-                        existing = attempt.scheduler.get("job_id")
-                        if existing == job_id:
-                            return
-                        attempt.scheduler["job_id"] = job_id
-
-                    StateManager.update_state(directory, mutate)
-                    if callback:
-                        try:
-                            callback(job_id)
-                        except Exception:
-                            # Avoid killing the watcher thread; state update already happened.
-                            logger = get_logger()
-                            logger.exception(
-                                "submitit watcher: job_id callback failed for %s: %s",
-                                directory,
-                                job_id,
-                            )
-                    break
-
-                if self.is_done(job):
-                    break
-
-                time.sleep(0.5)
-
-        thread = threading.Thread(target=watcher, daemon=True)
-        thread.start()
+        """Record the job ID in state, watching for it on a shared thread if needed."""
+        _ = attempt_id  # intentionally unused; queued->running attempt swap is expected
+        # submitit assigns the id during `submit()` for most executors, so record it
+        # right away; only jobs without one yet (e.g. inside `executor.batch()`) wait
+        # on the watcher thread.
+        job_id = self.get_job_id(job)
+        if job_id:
+            try:
+                self.record_job_id(directory, job_id, callback)
+                return
+            except Exception:
+                # The job is already submitted; a failed state update must not fail
+                # the submission. Leave it to the watcher thread to retry.
+                logger = get_logger()
+                logger.exception(
+                    "submitit watcher: failed to record job_id for %s: %s",
+                    directory,
+                    job_id,
+                )
+        _job_id_watcher.register(_WatchEntry(self, job, directory, callback))
+
+    def record_job_id(
+        self,
+        directory: Path,
+        job_id: str,
+        callback: Callable[[str], None] | None = None,
+    ) -> None:
+        """Store a newly observed job ID on the current submitit attempt."""
+        StateManager.update_state(directory, functools.partial(_set_job_id, job_id))
+        if callback:
+            try:
+                callback(job_id)
+            except Exception:
+                # Avoid killing the watcher thread; state update already happened.
+                logger = get_logger()
+                logger.exception(
+                    "submitit watcher: job_id callback failed for %s: %s",
+                    directory,
+                    job_id,
+                )
 
     def classify_scheduler_state(self, state: str | None) -> str | None:
         """Map scheduler state to Furu status."""
@@ -153,21 +188,16 @@ class SubmititAdapter:
 
         s = state.upper()
 
-        if "COMPLETE" in s or "COMPLETED" in s:
-            return "success"
-
-        if s in {
-            "PREEMPTED",
-            "TIMEOUT",
-            "NODE_FAIL",
-            "REQUEUED",
-            "REQUEUE_HOLD",
-        }:
-            return "preempted"
-
         if s == "CANCELLED":
             return "preempted" if FURU_CONFIG.cancelled_is_preempted else "failed"
 
+        exact = _EXACT_SCHEDULER_STATES.get(s)
+        if exact is not None:
+            return exact
+
+        if "COMPLETE" in s:
+            return "success"
+
         if "FAIL" in s or "ERROR" in s:
             return "failed"
 
@@ -214,3 +244,93 @@ class SubmititAdapter:
             "scheduler_state": scheduler_state,
             "reason": f"scheduler:{scheduler_state}",
         }
+
+
+_JOB_ID_POLL_INITIAL_SEC = 0.01
+_JOB_ID_POLL_MAX_SEC = 1.0
+
+
+@dataclass
+class _WatchEntry:
+    adapter: SubmititAdapter
+    job: SubmititJob
+    directory: Path
+    callback: Callable[[str], None] | None
+    # Job ids usually appear within milliseconds of submission; back off from a
+    # short first poll so long-queued jobs are checked rarely.
+    delay_sec: float = _JOB_ID_POLL_INITIAL_SEC
+
+
+class _JobIdWatcher:
+    """Poll every watched submitit job for its job ID from one shared daemon thread."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._deadlines: list[tuple[float, int]] = []
+        self._entries: dict[int, _WatchEntry] = {}
+        self._tokens = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def register(self, entry: _WatchEntry) -> None:
+        with self._condition:
+            token = next(self._tokens)
+            self._entries[token] = entry
+            heapq.heappush(self._deadlines, (time.monotonic(), token))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="furu-job-id-watcher", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _reset_after_fork(self) -> None:
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._entries = {}
+        self._thread = None
+
+    def _next_due(self) -> tuple[int, _WatchEntry]:
+        with self._condition:
+            while True:
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+                deadline, token = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._deadlines)
+                return token, self._entries[token]
+
+    def _run(self) -> None:
+        while True:
+            # Poll outside the condition so slow scheduler or filesystem calls
+            # never block new registrations.
+            token, entry = self._next_due()
+            try:
+                job_id = entry.adapter.get_job_id(entry.job)
+                if job_id:
+                    entry.adapter.record_job_id(entry.directory, job_id, entry.callback)
+                    finished = True
+                else:
+                    finished = entry.adapter.is_done(entry.job)
+            except Exception:
+                # One broken job must not stop the watcher serving every other job.
+                logger = get_logger()
+                logger.exception(
+                    "submitit watcher: failed to poll job for %s", entry.directory
+                )
+                finished = True
+            with self._condition:
+                if finished:
+                    del self._entries[token]
+                    continue
+                entry.delay_sec = min(entry.delay_sec * 2, _JOB_ID_POLL_MAX_SEC)
+                heapq.heappush(
+                    self._deadlines, (time.monotonic() + entry.delay_sec, token)
+                )
+
+
+_job_id_watcher = _JobIdWatcher()
+os.register_at_fork(after_in_child=_job_id_watcher._reset_after_fork)
@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from importlib import import_module
 from pathlib import Path
 from typing import Literal, cast
@@ -6,6 +7,8 @@ from typing import Literal, cast
 
 RecordGitMode = Literal["ignore", "cached", "uncached"]
 
+_TRUTHY = frozenset({"1", "true", "yes"})
+
 
 class FuruConfig:
     """Central configuration for Furu behavior."""
@@ -40,11 +43,7 @@ class FuruConfig:
         )
         self.max_requeues = int(os.getenv("FURU_PREEMPT_MAX", "5"))
         self.max_compute_retries = int(os.getenv("FURU_MAX_COMPUTE_RETRIES", "3"))
-        self.retry_failed = os.getenv("FURU_RETRY_FAILED", "1").lower() in {
-            "1",
-            "true",
-            "yes",
-        }
+        self.retry_failed = self._parse_bool(os.getenv("FURU_RETRY_FAILED", "1"))
         self.record_git = self._parse_record_git(os.getenv("FURU_RECORD_GIT", "cached"))
         self.allow_no_git_origin = self._parse_bool(
             os.getenv("FURU_ALLOW_NO_GIT_ORIGIN", "0")
@@ -70,13 +69,13 @@ class FuruConfig:
             }
         self._require_namespaces_exist(always_rerun_items)
         self.always_rerun = always_rerun_items
-        self.cancelled_is_preempted = os.getenv(
-            "FURU_CANCELLED_IS_PREEMPTED", "false"
-        ).lower() in {"1", "true", "yes"}
+        self.cancelled_is_preempted = self._parse_bool(
+            os.getenv("FURU_CANCELLED_IS_PREEMPTED", "false")
+        )
 
     @staticmethod
     def _parse_bool(value: str) -> bool:
-        return value.strip().lower() in {"1", "true", "yes"}
+        return value.strip().lower() in _TRUTHY
 
     @classmethod
     def _parse_record_git(cls, value: str) -> RecordGitMode:
@@ -99,7 +98,7 @@ class FuruConfig:
         if version_controlled:
             if self.version_controlled_root_override is not None:
                 return self.version_controlled_root_override
-            return self._resolve_version_controlled_root()
+            return self._version_controlled_root
         return self.base_root / "data"
 
     def get_submitit_root(self) -> Path:
@@ -112,6 +111,12 @@ class FuruConfig:
             return Path(env).expanduser().resolve()
         return None
 
+    @cached_property
+    def _version_controlled_root(self) -> Path:
+        # Resolved once per config, like `base_root`, instead of walking up from
+        # the cwd on every version-controlled path lookup.
+        return self._resolve_version_controlled_root()
+
     @classmethod
     def _resolve_version_controlled_root(cls) -> Path:
         project_root = cls._find_project_root()
@@ -1,15 +1,13 @@
 import datetime
-import getpass
 import inspect
 import os
 import signal
-import socket
 import sys
 import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
-from functools import cached_property
+from functools import cache, cached_property, partial
 from pathlib import Path
 from types import FrameType
 from typing import (
@@ -44,6 +42,7 @@ from ..errors import (
     FuruWaitTimeout,
 )
 from ..runtime import current_holder
+from ..runtime.env import hostname, username
 from ..runtime.logging import enter_holder, get_logger, log, write_separator
 from ..runtime.tracebacks import format_traceback
 from ..serialization import FuruSerializer
@@ -87,6 +86,10 @@ class _CallerInfo(TypedDict, total=False):
     furu_caller_line: int
 
 
+# Frames from files under this directory are skipped when locating the caller.
+_FURU_PKG_DIR = str(Path(__file__).parent.parent)
+
+
 @dataclass_transform(
     field_specifiers=(chz.field,), kw_only_default=True, frozen_default=True
 )
@@ -122,35 +125,22 @@ class Furu[T](ABC):
         # Python 3.14+ may not populate `__annotations__` in `cls.__dict__` (PEP 649).
         # `chz` expects annotations to exist for every `chz.field()` attribute, so we
         # materialize them and (as a last resort) fill missing ones with `Any`.
-        try:
-            annotations = dict(getattr(cls, "__annotations__", {}) or {})
-        except Exception:
-            annotations = {}
-
-        try:
-            materialized = inspect.get_annotations(cls, eval_str=False)
-        except TypeError:  # pragma: no cover
-            materialized = inspect.get_annotations(cls)
-        except Exception:
-            materialized = {}
-
-        if materialized:
-            annotations.update(materialized)
+        if sys.version_info >= (3, 14):
+            import annotationlib
 
-        FieldType: type[object] | None
-        try:
-            from chz.field import Field as _ChzField
-        except Exception:  # pragma: no cover
-            FieldType = None
+            # Deferred annotations are evaluated here; keep names that are not
+            # defined yet as forward references instead of raising NameError.
+            annotations = annotationlib.get_annotations(
+                cls, format=annotationlib.Format.FORWARDREF
+            )
         else:
-            FieldType = _ChzField
-
-        if FieldType is not None:
-            for field_name, value in cls.__dict__.items():
-                if isinstance(value, FieldType) and field_name not in annotations:
-                    annotations[field_name] = Any
-
-        if annotations:
+            annotations = inspect.get_annotations(cls)
+        needs_update = bool(annotations) and "__annotations__" not in cls.__dict__
+        for field_name, value in cls.__dict__.items():
+            if isinstance(value, ChzField) and field_name not in annotations:
+                annotations[field_name] = Any
+                needs_update = True
+        if needs_update:
             type.__setattr__(cls, "__annotations__", annotations)
 
         chz_kwargs: dict[str, str | bool] = {}
@@ -165,17 +155,10 @@ class Furu[T](ABC):
 
     @classmethod
     def _namespace(cls) -> Path:
-        module = getattr(cls, "__module__", None)
-        qualname = getattr(cls, "__qualname__", cls.__name__)
-        if not module or module == "__main__":
-            raise ValueError(
-                "Cannot derive Furu namespace from __main__; define the class in an importable module."
-            )
-        if "<locals>" in qualname:
-            raise ValueError(
-                "Cannot derive Furu namespace for a local class; define it at module scope."
-            )
-        return Path(*module.split("."), *qualname.split("."))
+        return _namespace_path(
+            getattr(cls, "__module__", None),
+            getattr(cls, "__qualname__", cls.__name__),
+        )
 
     @abstractmethod
     def _create(self: Self) -> T:
@@ -223,7 +206,9 @@ class Furu[T](ABC):
             digests.add(dependency.furu_hash)
         return sorted(digests)
 
-    def _invalidate_cached_success(self: Self, directory: Path, *, reason: str) -> None:
+    def _invalidate_cached_success(
+        self: Self, directory: Path, *, reason: str
+    ) -> _FuruState:
         logger = get_logger()
         logger.warning(
             "invalidate %s %s %s (%s)",
@@ -240,10 +225,11 @@ class Furu[T](ABC):
         def mutate(state: _FuruState) -> None:
             state.result = _StateResultAbsent(status="absent")
 
-        StateManager.update_state(directory, mutate)
+        state = StateManager.update_state(directory, mutate)
         StateManager.append_event(
             directory, {"type": "result_invalidated", "reason": reason, "at": now}
         )
+        return state
 
     def _prepare_executor_rerun(self: Self, directory: Path) -> None:
         if not self._always_rerun():
@@ -562,7 +548,9 @@ class Furu[T](ABC):
                                 # Since we didn't read state, we skip the logging below for speed
                                 # or we can log a minimal message if needed.
                                 ok = True
-                                self._log_console_start(action_color="green")
+                                self._log_console_start(
+                                    action_color="green", caller_info=caller_info
+                                )
                                 return self._load()
                         except Exception as e:
                             self._invalidate_cached_success(
@@ -586,23 +574,20 @@ class Furu[T](ABC):
                 if isinstance(state0.result, _StateResultSuccess):
                     # Double check logic if we fell through to here (e.g. race condition or invalidation above)
                     if self._always_rerun():
-                        self._invalidate_cached_success(
+                        state0 = self._invalidate_cached_success(
                             directory, reason="always_rerun enabled"
                         )
-                        state0 = StateManager.read_state(directory)
                     else:
                         try:
                             if not self._validate():
-                                self._invalidate_cached_success(
+                                state0 = self._invalidate_cached_success(
                                     directory, reason="_validate returned false"
                                 )
-                                state0 = StateManager.read_state(directory)
                         except Exception as e:
-                            self._invalidate_cached_success(
+                            state0 = self._invalidate_cached_success(
                                 directory,
                                 reason=f"_validate raised {type(e).__name__}: {e}",
                             )
-                            state0 = StateManager.read_state(directory)
 
                 attempt0 = state0.attempt
                 if isinstance(state0.result, _StateResultSuccess):
@@ -640,8 +625,7 @@ class Furu[T](ABC):
                     )
 
                 # Fast path: already successful
-                state_now = StateManager.read_state(directory)
-                if isinstance(state_now.result, _StateResultSuccess):
+                if isinstance(state0.result, _StateResultSuccess):
                     try:
                         result = self._load()
                         ok = True
@@ -701,11 +685,10 @@ class Furu[T](ABC):
         caller_info: _CallerInfo = {}
         if frame is not None:
             # Walk up the stack to find the caller outside of furu package
-            furu_pkg_dir = str(Path(__file__).parent.parent)
             while frame is not None:
                 filename = frame.f_code.co_filename
                 # Skip frames from within the furu package
-                if not filename.startswith(furu_pkg_dir):
+                if not filename.startswith(_FURU_PKG_DIR):
                     caller_info = {
                         "furu_caller_file": filename,
                         "furu_caller_line": frame.f_lineno,
@@ -733,6 +716,68 @@ class Furu[T](ABC):
             },
         )
 
+    def _record_attempt_failure(
+        self,
+        exc: Exception,
+        directory: Path,
+        *,
+        attempt_id: str,
+        stage: str,
+    ) -> None:
+        """Log and record a failed attempt unless it was already marked preempted."""
+        logger = get_logger()
+        attempt = StateManager.read_state(directory).attempt
+        if (
+            attempt is not None
+            and attempt.id == attempt_id
+            and attempt.status == "preempted"
+        ):
+            # The attempt was already finalized elsewhere (signal handler or stale
+            # reconcile); skip rendering tracebacks for a result nobody will record.
+            logger.warning(
+                "attempt %s already preempted; not recording %s failure %s %s",
+                attempt_id,
+                stage,
+                self.__class__.__name__,
+                self.furu_hash,
+                extra={"furu_file_only": True},
+            )
+            self._add_exception_breadcrumbs(exc, directory)
+            return
+
+        # Record the failure before rendering the (slow) rich traceback, so waiters
+        # polling for a terminal status are not held up by log formatting.
+        tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        StateManager.finish_attempt_failed(
+            directory,
+            attempt_id=attempt_id,
+            error={
+                "type": type(exc).__name__,
+                "message": str(exc),
+                "traceback": tb,
+            },
+        )
+
+        if stage == "_create":
+            logger.error(
+                "_create failed %s %s %s",
+                self.__class__.__name__,
+                self.furu_hash,
+                directory,
+                extra={"furu_file_only": True},
+            )
+        else:
+            logger.error(
+                "attempt failed (%s) %s %s %s",
+                stage,
+                self.__class__.__name__,
+                self.furu_hash,
+                directory,
+                extra={"furu_file_only": True},
+            )
+        logger.error("%s", format_traceback(exc), extra={"furu_file_only": True})
+        self._add_exception_breadcrumbs(exc, directory)
+
     def _add_exception_breadcrumbs(self, exc: BaseException, directory: Path) -> None:
         if not hasattr(exc, "add_note"):
             return
@@ -828,14 +873,14 @@ class Furu[T](ABC):
         return None
 
     def _success_marker_dir(self, directory: Path) -> Path | None:
-        base_marker = StateManager.success_marker_exists(directory)
+        # A local success marker always wins over an alias, so skip reading the
+        # migration record in the common case.
+        if StateManager.success_marker_exists(directory):
+            return directory
         record = self._alias_record(directory)
         if record is None:
-            return directory if base_marker else None
-        target_dir = self._alias_target_dir(directory, record, base_marker=base_marker)
-        if target_dir is not None:
-            return target_dir
-        return directory if base_marker else None
+            return None
+        return self._alias_target_dir(directory, record, base_marker=False)
 
     def _alias_is_active(self, directory: Path, record: MigrationRecord) -> bool:
         return self._alias_target_dir(directory, record) is not None
@@ -880,8 +925,7 @@ class Furu[T](ABC):
         """Submit job once without waiting (fire-and-forget mode)."""
         logger = get_logger()
         StateManager.ensure_internal_dir(directory)
-        self._reconcile(directory, adapter=adapter)
-        state = StateManager.read_state(directory)
+        state = self._reconcile(directory, adapter=adapter)
         attempt = state.attempt
         if (
             isinstance(attempt, (_StateAttemptQueued, _StateAttemptRunning))
@@ -896,21 +940,25 @@ class Furu[T](ABC):
         lock_fd = StateManager.try_lock(lock_path)
 
         if lock_fd is None:
-            # Someone else is submitting, wait briefly and return their job
+            # Someone else is submitting. Load their job as soon as they pickle it
+            # or release the lock, waiting no longer than the old fixed nap.
             logger.debug(
                 "submit: waiting for submit lock %s %s %s",
                 self.__class__.__name__,
                 self.furu_hash,
                 directory,
             )
-            time.sleep(0.5)
+            job_path = StateManager.get_internal_dir(directory) / adapter.JOB_PICKLE
+            StateManager.wait_for_lock_release(lock_path, 0.5, ready_file=job_path)
             return adapter.load_job(directory)
 
         attempt_id: str | None = None
         try:
-            # Create metadata
-            metadata = MetadataManager.create_metadata(self, directory)
-            MetadataManager.write_metadata(metadata, directory)
+            # Create metadata on first submission only; resubmissions keep the
+            # existing file and the worker refreshes it under the compute lock.
+            if not MetadataManager.get_metadata_path(directory).is_file():
+                metadata = MetadataManager.create_metadata(self, directory)
+                MetadataManager.write_metadata(metadata, directory)
 
             env_info = MetadataManager.collect_environment_info()
             owner_state = StateOwner(
@@ -943,7 +991,7 @@ class Furu[T](ABC):
                 scheduler={},
             )
 
-            job = adapter.submit(lambda: self._worker_entry(allow_failed=allow_failed))
+            job = adapter.submit(partial(self._worker_entry, allow_failed=allow_failed))
 
             # Save job handle and watch for job ID
             adapter.pickle_job(job, directory)
@@ -1024,8 +1072,8 @@ class Furu[T](ABC):
                         heartbeat_interval_sec=FURU_CONFIG.heartbeat_interval_sec,
                         owner={
                             "pid": os.getpid(),
-                            "host": socket.gethostname(),
-                            "user": getpass.getuser(),
+                            "host": hostname(),
+                            "user": username(),
                             "command": " ".join(sys.argv) if sys.argv else "<unknown>",
                         },
                         scheduler={
@@ -1092,42 +1140,9 @@ class Furu[T](ABC):
                                 extra={"furu_console_only": True},
                             )
                         except Exception as e:
-                            if stage == "_create":
-                                logger.error(
-                                    "_create failed %s %s %s",
-                                    self.__class__.__name__,
-                                    self.furu_hash,
-                                    directory,
-                                    extra={"furu_file_only": True},
-                                )
-                            else:
-                                logger.error(
-                                    "attempt failed (%s) %s %s %s",
-                                    stage,
-                                    self.__class__.__name__,
-                                    self.furu_hash,
-                                    directory,
-                                    extra={"furu_file_only": True},
-                                )
-                            logger.error(
-                                "%s",
-                                format_traceback(e),
-                                extra={"furu_file_only": True},
-                            )
-
-                            tb = "".join(
-                                traceback.format_exception(type(e), e, e.__traceback__)
-                            )
-                            StateManager.finish_attempt_failed(
-                                directory,
-                                attempt_id=ctx.attempt_id,
-                                error={
-                                    "type": type(e).__name__,
-                                    "message": str(e),
-                                    "traceback": tb,
-                                },
+                            self._record_attempt_failure(
+                                e, directory, attempt_id=ctx.attempt_id, stage=stage
                             )
-                            self._add_exception_breadcrumbs(e, directory)
                             if stage != "_create":
                                 message = (
                                     "Failed to create metadata"
@@ -1183,8 +1198,8 @@ class Furu[T](ABC):
             "backend": "slurm" if slurm_id else "local",
             "slurm_job_id": slurm_id,
             "pid": os.getpid(),
-            "host": socket.gethostname(),
-            "user": getpass.getuser(),
+            "host": hostname(),
+            "user": username(),
             "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(
                 timespec="seconds"
             ),
@@ -1225,8 +1240,8 @@ class Furu[T](ABC):
                 heartbeat_interval_sec=FURU_CONFIG.heartbeat_interval_sec,
                 owner={
                     "pid": os.getpid(),
-                    "host": socket.gethostname(),
-                    "user": getpass.getuser(),
+                    "host": hostname(),
+                    "user": username(),
                     "command": " ".join(sys.argv) if sys.argv else "<unknown>",
                 },
                 scheduler={},
@@ -1293,41 +1308,9 @@ class Furu[T](ABC):
                     )
                     return "success", True, result
                 except Exception as e:
-                    if stage == "_create":
-                        logger.error(
-                            "_create failed %s %s %s",
-                            self.__class__.__name__,
-                            self.furu_hash,
-                            directory,
-                            extra={"furu_file_only": True},
-                        )
-                    else:
-                        logger.error(
-                            "attempt failed (%s) %s %s %s",
-                            stage,
-                            self.__class__.__name__,
-                            self.furu_hash,
-                            directory,
-                            extra={"furu_file_only": True},
-                        )
-                    logger.error(
-                        "%s", format_traceback(e), extra={"furu_file_only": True}
-                    )
-
-                    # Record failure (plain text in file)
-                    tb = "".join(
-                        traceback.format_exception(type(e), e, e.__traceback__)
+                    self._record_attempt_failure(
+                        e, directory, attempt_id=ctx.attempt_id, stage=stage
                     )
-                    StateManager.finish_attempt_failed(
-                        directory,
-                        attempt_id=ctx.attempt_id,
-                        error={
-                            "type": type(e).__name__,
-                            "message": str(e),
-                            "traceback": tb,
-                        },
-                    )
-                    self._add_exception_breadcrumbs(e, directory)
                     if stage != "_create":
                         message = (
                             "Failed to create metadata"
@@ -1352,12 +1335,11 @@ class Furu[T](ABC):
 
     def _reconcile(
         self: Self, directory: Path, *, adapter: SubmititAdapter | None = None
-    ) -> None:
+    ) -> _FuruState:
         if adapter is None:
-            StateManager.reconcile(directory)
-            return
+            return StateManager.reconcile(directory)
 
-        StateManager.reconcile(
+        return StateManager.reconcile(
             directory,
             submitit_probe=lambda state: adapter.probe(directory, state),
         )
@@ -1373,17 +1355,31 @@ class Furu[T](ABC):
         if threading.current_thread() is not threading.main_thread():
             return
 
+        preempting = threading.Event()
+
+        def record_preemption(signum: int) -> None:
+            StateManager.finish_attempt_preempted(
+                directory,
+                attempt_id=attempt_id,
+                error={"type": "signal", "message": f"signal:{signum}"},
+            )
+
         def handle_signal(signum: int, frame: FrameType | None) -> None:
-            try:
-                StateManager.finish_attempt_preempted(
-                    directory,
-                    attempt_id=attempt_id,
-                    error={"type": "signal", "message": f"signal:{signum}"},
-                )
-            finally:
-                stop_heartbeat()
-                exit_code = 143 if signum == signal.SIGTERM else 130
+            exit_code = 143 if signum == signal.SIGTERM else 130
+            if preempting.is_set():
+                # A repeated signal while the first is being recorded: just exit.
                 os._exit(exit_code)
+            preempting.set()
+            # Record the preemption on a worker thread with a bounded wait: the
+            # interrupted main thread may hold the state lock, and re-acquiring it
+            # from the handler would stall until the lock wait times out.
+            writer = threading.Thread(
+                target=record_preemption, args=(signum,), daemon=True
+            )
+            writer.start()
+            writer.join(timeout=2.0)
+            stop_heartbeat()
+            os._exit(exit_code)
 
         for sig in (signal.SIGTERM, signal.SIGINT):
             signal.signal(sig, handle_signal)
@@ -1410,6 +1406,20 @@ DependencyScanValue: TypeAlias = (
 )
 
 
+@cache
+def _namespace_path(module: str | None, qualname: str) -> Path:
+    # Keyed on the names rather than the class so renamed classes resolve afresh.
+    if not module or module == "__main__":
+        raise ValueError(
+            "Cannot derive Furu namespace from __main__; define the class in an importable module."
+        )
+    if "<locals>" in qualname:
+        raise ValueError(
+            "Cannot derive Furu namespace for a local class; define it at module scope."
+        )
+    return Path(*module.split("."), *qualname.split("."))
+
+
 def _collect_dependencies(
     obj: Furu,
     dependencies: list[Furu],
@@ -1432,10 +1442,15 @@ def _collect_dependencies(
             )
 
 
+@cache
+def _field_logical_names(data_class: type) -> tuple[str, ...]:
+    return tuple(field.logical_name for field in chz.chz_fields(data_class).values())
+
+
 def _direct_dependencies(obj: Furu) -> list[Furu]:
     dependencies: list[Furu] = []
-    for field in chz.chz_fields(obj).values():
-        value = cast(DependencyScanValue, getattr(obj, field.logical_name))
+    for name in _field_logical_names(type(obj)):
+        value = cast(DependencyScanValue, getattr(obj, name))
         dependencies.extend(_collect_dependencies_from_value(value))
     extra = obj._dependencies()
     if extra is not None:
@@ -1444,6 +1459,9 @@ def _direct_dependencies(obj: Furu) -> list[Furu]:
 
 
 def _collect_dependencies_from_value(value: DependencyScanValue) -> list[Furu]:
+    # Leaves are by far the most common values; skip the container checks for them.
+    if value is None or isinstance(value, (str, int, float, Path, bytes)):
+        return []
     dependencies: list[Furu] = []
     if isinstance(value, Furu):
         dependencies.append(value)
@@ -1464,8 +1482,8 @@ def _collect_dependencies_from_value(value: DependencyScanValue) -> list[Furu]:
             dependencies.extend(_collect_dependencies_from_value(item))
         return dependencies
     if chz.is_chz(value):
-        for field in chz.chz_fields(value).values():
-            field_value = cast(DependencyScanValue, getattr(value, field.logical_name))
+        for name in _field_logical_names(type(value)):
+            field_value = cast(DependencyScanValue, getattr(value, name))
             dependencies.extend(_collect_dependencies_from_value(field_value))
     return dependencies
 
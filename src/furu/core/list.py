@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Generator,
     Generic,
@@ -16,15 +17,51 @@ _H = TypeVar("_H", bound=Furu, covariant=True)
 class _FuruListMeta(type):
     """Metaclass that provides collection methods for FuruList subclasses."""
 
+    _ENTRIES_CACHE_ATTR = "_furu_entries_cache"
+    _NAME_INDEX_CACHE_ATTR = "_furu_name_index_cache"
+
+    def __setattr__(cls, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            cls._invalidate_entries()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_"):
+            cls._invalidate_entries()
+
+    def _invalidate_entries(cls) -> None:
+        """Drop the cached entries and name index so the next access rebuilds them."""
+        for attr in (
+            _FuruListMeta._ENTRIES_CACHE_ATTR,
+            _FuruListMeta._NAME_INDEX_CACHE_ATTR,
+        ):
+            if attr in cls.__dict__:
+                type.__delattr__(cls, attr)
+
     def _entries(cls: "type[FuruList[_H]]") -> list[_H]:
+        """Return all Furu instances from class attributes, cached per class."""
+        cached = cls.__dict__.get(_FuruListMeta._ENTRIES_CACHE_ATTR)
+        if cached is None:
+            cached = cls._collect_entries()
+            type.__setattr__(cls, _FuruListMeta._ENTRIES_CACHE_ATTR, cached)
+        return cached
+
+    def _collect_entries(cls: "type[FuruList[_H]]") -> list[_H]:
         """Collect all Furu instances from class attributes."""
         items: list[_H] = []
         seen: set[str] = set()
+        seen_ids: set[int] = set()
 
         def maybe_add(obj: object) -> None:
             if not isinstance(obj, Furu):
                 raise TypeError(f"{obj!r} is not a Furu instance")
 
+            # The same instance may be listed under several names; skip hashing it again.
+            if id(obj) in seen_ids:
+                return
+            seen_ids.add(id(obj))
+
             furu_obj = cast(Furu, obj)
             digest = furu_obj.furu_hash
             if digest not in seen:
@@ -46,13 +83,51 @@ class _FuruListMeta(type):
 
         return items
 
+    def _name_index(cls: "type[FuruList[_H]]") -> dict[str, _H]:
+        """Return a name -> instance index over top-level and nested dict entries."""
+        cached = cls.__dict__.get(_FuruListMeta._NAME_INDEX_CACHE_ATTR)
+        if cached is not None:
+            return cached
+
+        index: dict[str, _H] = {}
+        # Nested dict keys resolve to the first dict that contains them.
+        for value in cls.__dict__.values():
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    index.setdefault(key, cast(_H, item))
+        # Top-level attributes take precedence over nested dict keys.
+        for name, value in cls.__dict__.items():
+            if value and not callable(value) and not name.startswith("_"):
+                index[name] = cast(_H, value)
+
+        type.__setattr__(cls, _FuruListMeta._NAME_INDEX_CACHE_ATTR, index)
+        return index
+
     def __iter__(cls: "type[FuruList[_H]]") -> Iterator[_H]:
         """Iterate over all Furu instances."""
         return iter(cls._entries())
 
     def all(cls: "type[FuruList[_H]]") -> list[_H]:
         """Get all Furu instances as a list."""
-        return cls._entries()
+        return list(cls._entries())
+
+    def exists_all(
+        cls: "type[FuruList[_H]]", *, max_workers: int = 32
+    ) -> dict[str, bool]:
+        """
+        Check `exists()` for every entry concurrently, keyed by `furu_hash`.
+
+        The checks are dominated by filesystem stats and reads, so a thread pool
+        overlaps them even under the GIL.
+        """
+        entries = cls._entries()
+        if not entries:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(entries))) as pool:
+            results = pool.map(lambda entry: entry.exists(), entries)
+            return {
+                entry.furu_hash: ok for entry, ok in zip(entries, results, strict=True)
+            }
 
     def items_iter(
         cls: "type[FuruList[_H]]",
@@ -80,14 +155,9 @@ class _FuruListMeta(type):
 
     def by_name(cls: "type[FuruList[_H]]", name: str, *, strict: bool = True):
         """Get Furu instance by name."""
-        attr = cls.__dict__.get(name)
-        if attr and not callable(attr) and not name.startswith("_"):
-            return cast(_H, attr)
-
-        # Check nested dicts
-        for value in cls.__dict__.values():
-            if isinstance(value, dict) and name in value:
-                return cast(_H, value[name])
+        index = cls._name_index()
+        if name in index:
+            return index[name]
 
         if strict:
             raise KeyError(f"{cls.__name__} has no entry named '{name}'")
@@ -119,6 +189,11 @@ class FuruList(Generic[_H], metaclass=_FuruListMeta):
         for exp in MyExperiments:
             result = exp.get()
             print(result)
+
+    Entries are collected once per class and cached. Assigning or deleting a class
+    attribute refreshes the cache, but in-place changes to a nested dict or list
+    (`MyExperiments.group["x"] = exp`) are not seen until the attribute is
+    reassigned.
     """
 
     pass
@@ -55,6 +55,9 @@ def create_app(*, serve_frontend: bool = False) -> FastAPI:
     # Serve frontend only if explicitly requested
     if serve_frontend:
         frontend_dir = get_frontend_dir()
+        # Resolved once here; resolving per request costs an lstat per component.
+        frontend_root = frontend_dir.resolve()
+        index_file = frontend_root / "index.html"
 
         # Mount static assets
         assets_dir = frontend_dir / "assets"
@@ -68,13 +71,12 @@ def create_app(*, serve_frontend: bool = False) -> FastAPI:
             requested = Path(full_path)
             if ".." in requested.parts:
                 raise HTTPException(status_code=404, detail="Not found")
-            frontend_root = frontend_dir.resolve()
-            file_path = (frontend_dir / requested).resolve()
+            file_path = (frontend_root / requested).resolve()
             if not file_path.is_relative_to(frontend_root):
                 raise HTTPException(status_code=404, detail="Not found")
             if file_path.is_file() and not full_path.startswith("api"):
                 return FileResponse(file_path)
-            return FileResponse(frontend_dir / "index.html")
+            return FileResponse(index_file)
 
     return app
 
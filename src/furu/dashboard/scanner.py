@@ -1,7 +1,8 @@
 """Filesystem scanner for discovering and parsing Furu experiment state."""
 
 import datetime as _dt
-from collections import defaultdict
+import os
+from collections import Counter, defaultdict
 from collections.abc import Iterator
 from pathlib import Path
 from typing import cast
@@ -146,14 +147,31 @@ def _state_to_summary(
 
 def _find_experiment_dirs(root: Path) -> list[Path]:
     """Find all directories containing .furu/state.json files."""
-    experiments = []
-
-    # Walk the directory tree looking for .furu directories
-    for furu_dir in root.rglob(StateManager.INTERNAL_DIR):
-        if furu_dir.is_dir():
-            state_file = furu_dir / StateManager.STATE_FILE
-            if state_file.is_file():
-                experiments.append(furu_dir.parent)
+    experiments: list[Path] = []
+
+    # Walk with os.scandir on plain strings instead of rglob, and stop at each
+    # experiment directory: its remaining contents are artifacts, not experiments.
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = [
+                    entry for entry in entries if entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            # Like rglob, skip directories that vanish or cannot be read mid-walk.
+            continue
+        if any(entry.name == StateManager.INTERNAL_DIR for entry in subdirs):
+            state_file = os.path.join(
+                directory, StateManager.INTERNAL_DIR, StateManager.STATE_FILE
+            )
+            if os.path.isfile(state_file):
+                experiments.append(Path(directory))
+                continue
+        pending.extend(
+            entry.path for entry in subdirs if entry.name != StateManager.INTERNAL_DIR
+        )
 
     return experiments
 
@@ -271,8 +289,17 @@ def scan_experiments(
     if config_filter and "=" in config_filter:
         config_field, config_value = config_filter.split("=", 1)
 
+    # Resolved namespaces mirror directory paths, so every match lives under the
+    # prefix's complete components (the last one may be partial, e.g. "Train").
+    # The original view reports aliases under their source namespace instead.
+    prefix_dirs: list[str] = []
+    if namespace_prefix and view == "resolved":
+        prefix_parts = namespace_prefix.split(".")[:-1]
+        if all(part.isidentifier() for part in prefix_parts):
+            prefix_dirs = prefix_parts
+
     for root in _iter_roots():
-        for experiment_dir in _find_experiment_dirs(root):
+        for experiment_dir in _find_experiment_dirs(root.joinpath(*prefix_dirs)):
             state = StateManager.read_state(experiment_dir)
             namespace, furu_hash = _parse_namespace_from_path(experiment_dir, root)
             migration = MigrationManager.read_migration(experiment_dir)
@@ -315,56 +342,53 @@ def scan_experiments(
                     continue
                 seen_original.add(original_key)
 
-            summary = _state_to_summary(
-                state,
-                namespace,
-                furu_hash,
-                migration=migration,
-                original_status=original_status,
-                original_namespace=migration.from_namespace if migration else None,
-                original_hash=migration.from_hash if migration else None,
-            )
-
-            if (
+            # In the resolved view an active alias reports the original's attempt.
+            override_attempts = (
                 migration is not None
                 and migration.kind == "alias"
                 and view == "resolved"
                 and alias_active
                 and original_state is not None
-            ):
-                summary = _override_summary_attempts(summary, original_state)
+            )
+            attempt_state = (
+                original_state
+                if override_attempts and original_state is not None
+                else state
+            )
+            attempt = attempt_state.attempt
 
-            filter_updated_at = summary.updated_at
+            # Apply filters before building the summary, so rows that are filtered
+            # out never pay for model construction.
+            if result_status and state.result.status != result_status:
+                continue
             if (
-                migration is not None
-                and migration.kind == "alias"
-                and view == "resolved"
-                and alias_active
-                and original_state is not None
+                attempt_status
+                and (attempt.status if attempt else None) != attempt_status
             ):
-                filter_updated_at = original_state.updated_at
-
-            # Apply filters
-            if result_status and summary.result_status != result_status:
-                continue
-            if attempt_status and summary.attempt_status != attempt_status:
                 continue
-            if namespace_prefix and not summary.namespace.startswith(namespace_prefix):
+            if namespace_prefix and not namespace.startswith(namespace_prefix):
                 continue
-            if backend and summary.backend != backend:
+            if backend and (attempt.backend if attempt else None) != backend:
                 continue
-            if hostname and summary.hostname != hostname:
+            if hostname and (attempt.owner.hostname if attempt else None) != hostname:
                 continue
-            if user and summary.user != user:
+            if user and (attempt.owner.user if attempt else None) != user:
                 continue
-            if migration_kind and summary.migration_kind != migration_kind:
+            if (
+                migration_kind
+                and (_migration_kind(migration) if migration else None)
+                != migration_kind
+            ):
                 continue
-            if migration_policy and summary.migration_policy != migration_policy:
+            if (
+                migration_policy
+                and (migration.policy if migration else None) != migration_policy
+            ):
                 continue
 
             # Date filters
             if started_after_dt or started_before_dt:
-                started_dt = _parse_datetime(summary.started_at)
+                started_dt = _parse_datetime(attempt.started_at if attempt else None)
                 if started_dt:
                     if started_after_dt and started_dt < started_after_dt:
                         continue
@@ -375,7 +399,7 @@ def scan_experiments(
                     continue
 
             if updated_after_dt or updated_before_dt:
-                updated_dt = _parse_datetime(filter_updated_at)
+                updated_dt = _parse_datetime(attempt_state.updated_at)
                 if updated_dt:
                     if updated_after_dt and updated_dt < updated_after_dt:
                         continue
@@ -403,6 +427,17 @@ def scan_experiments(
                 else:
                     continue
 
+            summary = _state_to_summary(
+                state,
+                namespace,
+                furu_hash,
+                migration=migration,
+                original_status=original_status,
+                original_namespace=migration.from_namespace if migration else None,
+                original_hash=migration.from_hash if migration else None,
+            )
+            if override_attempts and original_state is not None:
+                summary = _override_summary_attempts(summary, original_state)
             experiments.append(summary)
 
     # Sort by updated_at (newest first), with None values at the end
@@ -540,33 +575,18 @@ def get_stats() -> DashboardStats:
     Returns:
         Dashboard statistics including counts by status
     """
-    result_counts: dict[str, int] = defaultdict(int)
-    attempt_counts: dict[str, int] = defaultdict(int)
+    result_counts: Counter[str] = Counter()
+    attempt_counts: Counter[str] = Counter()
     total = 0
-    running = 0
-    queued = 0
-    failed = 0
-    success = 0
 
     for root in _iter_roots():
         for experiment_dir in _find_experiment_dirs(root):
             state = StateManager.read_state(experiment_dir)
             total += 1
-
             result_counts[state.result.status] += 1
-
-            if state.result.status == "success":
-                success += 1
-            elif state.result.status == "failed":
-                failed += 1
-
             attempt = state.attempt
             if attempt:
                 attempt_counts[attempt.status] += 1
-                if attempt.status == "running":
-                    running += 1
-                elif attempt.status == "queued":
-                    queued += 1
 
     return DashboardStats(
         total=total,
@@ -578,10 +598,10 @@ def get_stats() -> DashboardStats:
             StatusCount(status=status, count=count)
             for status, count in sorted(attempt_counts.items())
         ],
-        running_count=running,
-        queued_count=queued,
-        failed_count=failed,
-        success_count=success,
+        running_count=attempt_counts["running"],
+        queued_count=attempt_counts["queued"],
+        failed_count=result_counts["failed"],
+        success_count=result_counts["success"],
     )
 
 
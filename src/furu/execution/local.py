@@ -162,14 +162,20 @@ def run_local(
                 return
 
             if not inflight and not ready:
-                if any(node.status == "IN_PROGRESS" for node in plan.nodes.values()):
+                in_progress = [
+                    node.obj._base_furu_dir()
+                    for node in plan.nodes.values()
+                    if node.status == "IN_PROGRESS"
+                ]
+                if in_progress:
                     stale_detected = reconcile_or_timeout_in_progress(
                         plan,
                         stale_timeout_sec=FURU_CONFIG.stale_timeout,
                     )
                     if stale_detected:
                         continue
-                    time.sleep(poll_interval_sec)
+                    # Another process owns these; wake as soon as one of them moves.
+                    StateManager.wait_for_any_change(in_progress, poll_interval_sec)
                     continue
                 todo_nodes = [
                     node for node in plan.nodes.values() if node.status == "TODO"
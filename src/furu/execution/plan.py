@@ -65,11 +65,11 @@ def _migration_record(directory: Path, cache: _PlanCache) -> MigrationRecord | N
 def _alias_target_dir(base_dir: Path, cache: _PlanCache) -> Path | None:
     if base_dir in cache.alias_targets:
         return cache.alias_targets[base_dir]
-    record = _migration_record(base_dir, cache)
-    if record is None or record.kind != "alias" or record.overwritten_at is not None:
+    if _marker_exists(base_dir, cache):
         cache.alias_targets[base_dir] = None
         return None
-    if _marker_exists(base_dir, cache):
+    record = _migration_record(base_dir, cache)
+    if record is None or record.kind != "alias" or record.overwritten_at is not None:
         cache.alias_targets[base_dir] = None
         return None
     target_dir = MigrationManager.resolve_dir(record, target="from")
@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..adapters import SubmititAdapter
 from ..adapters.submitit import SubmititJob
@@ -17,6 +18,9 @@ from .plan import DependencyPlan, build_plan, topo_order_todo
 from .slurm_spec import SlurmSpec, SlurmSpecExtraValue
 from .submitit_factory import make_executor_for_spec
 
+if TYPE_CHECKING:
+    import submitit
+
 
 @dataclass
 class SlurmDagSubmission:
@@ -199,6 +203,7 @@ def submit_slurm_dag(
     order = topo_order_todo(plan)
     job_id_by_hash: dict[str, str] = {}
     root_job_ids: dict[str, str] = {}
+    independent_executors: dict[str, submitit.AutoExecutor] = {}
 
     root_hashes = {root.furu_hash for root in roots}
 
@@ -220,13 +225,19 @@ def submit_slurm_dag(
             )
 
         spec = specs[spec_key]
-        executor = make_executor_for_spec(
-            spec_key,
-            spec,
-            kind="nodes",
-            submitit_root=submitit_root,
-            run_id=run_id,
-        )
+        # Nodes without dependencies share one executor per spec; nodes with
+        # dependencies need their own because the afterok parameter differs.
+        executor = None if dep_job_ids else independent_executors.get(spec_key)
+        if executor is None:
+            executor = make_executor_for_spec(
+                spec_key,
+                spec,
+                kind="nodes",
+                submitit_root=submitit_root,
+                run_id=run_id,
+            )
+            if not dep_job_ids:
+                independent_executors[spec_key] = executor
         if dep_job_ids:
             dependency = "afterok:" + ":".join(dep_job_ids)
             slurm_params: dict[str, SlurmSpecExtraValue] = {"dependency": dependency}
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import os
-import socket
 import threading
 import time
 import uuid
@@ -17,6 +17,7 @@ from ..adapters.submitit import SubmititJob
 from ..config import FURU_CONFIG
 from ..core import Furu
 from ..errors import FuruComputeError, FuruMissingArtifact, FuruSpecMismatch
+from ..runtime.env import hostname
 from ..runtime.logging import get_logger
 from ..serialization.serializer import JsonValue
 from ..storage.state import _FuruState, _StateResultFailed, _StateResultSuccess
@@ -412,13 +413,13 @@ def _heartbeat_path(task_path: Path) -> Path:
 
 
 def _touch_heartbeat(path: Path) -> None:
-    now = time.time()
-    path.parent.mkdir(parents=True, exist_ok=True)
+    # The file exists on every tick but the first, so a bare utime usually suffices.
     with contextlib.suppress(OSError):
-        if path.exists():
-            os.utime(path, (now, now))
-            return
-        path.touch()
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
 
 
 def _heartbeat_loop(
@@ -480,7 +481,7 @@ def pool_worker_main(
     idle_timeout_sec: float,
     poll_interval_sec: float,
 ) -> None:
-    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    worker_id = f"{hostname()}-{os.getpid()}"
     last_task_time = time.time()
 
     while True:
@@ -820,7 +821,8 @@ def run_slurm_pool(
             )
             adapter = SubmititAdapter(executor)
             job = adapter.submit(
-                lambda: pool_worker_main(
+                functools.partial(
+                    pool_worker_main,
                     run_dir,
                     spec_key,
                     idle_timeout_sec=idle_timeout_sec,
@@ -1,8 +1,25 @@
+import functools
+import getpass
+import socket
+
+
 def load_env() -> None:
     from dotenv import load_dotenv
 
     load_dotenv()
 
 
+@functools.cache
+def hostname() -> str:
+    """Return the host name, cached since it is fixed for the life of the process."""
+    return socket.gethostname()
+
+
+@functools.cache
+def username() -> str:
+    """Return the login name, cached since `getpass.getuser` may consult NSS/LDAP."""
+    return getpass.getuser()
+
+
 # Preserve previous behavior: attempt to load `.env` at import-time.
 # load_env() # TODO: find a nice way to auto load .env if needed
@@ -1,5 +1,6 @@
 import datetime
 import enum
+import functools
 import hashlib
 import importlib
 import json
@@ -19,6 +20,43 @@ from pydantic import BaseModel as PydanticBaseModel
 # library handles arbitrary user-defined objects that we cannot know at compile time.
 JsonValue = Any
 
+# Exact types that canonicalize to themselves. Subclasses (e.g. IntEnum) still take
+# the generic path so they hash as before.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@runtime_checkable
+class _DependencyHashProvider(Protocol):
+    def _dependency_hashes(self) -> Sequence[str]: ...
+
+
+@functools.cache
+def _hashed_fields(data_class: type) -> tuple[tuple[str, ...], bool]:
+    # Per-class facts for `compute_hash`: the public field names, and whether the
+    # class reports dependency hashes (a runtime protocol check per object is slow).
+    names = tuple(
+        name for name in chz.chz_fields(data_class) if not name.startswith("_")
+    )
+    return names, hasattr(data_class, "_dependency_hashes")
+
+
+def _has_required_fields(
+    data_class: type[object],
+    data: dict[str, JsonValue],
+) -> bool:
+    if not chz.is_chz(data_class):
+        return False
+    for field in chz.chz_fields(data_class).values():
+        name = field.logical_name
+        if name in data:
+            continue
+        if field._default is not CHZ_MISSING:
+            continue
+        if not isinstance(field._default_factory, MISSING_TYPE):
+            continue
+        return False
+    return True
+
 
 class FuruSerializer:
     """Handles serialization, deserialization, and hashing of Furu objects."""
@@ -92,45 +130,35 @@ class FuruSerializer:
     def compute_hash(cls, obj: object, verbose: bool = False) -> str:
         """Compute deterministic hash of object."""
 
-        @runtime_checkable
-        class _DependencyHashProvider(Protocol):
-            def _dependency_hashes(self) -> Sequence[str]: ...
-
-        def _has_required_fields(
-            data_class: type[object],
-            data: dict[str, JsonValue],
-        ) -> bool:
-            if not chz.is_chz(data_class):
-                return False
-            for field in chz.chz_fields(data_class).values():
-                name = field.logical_name
-                if name in data:
-                    continue
-                if field._default is not CHZ_MISSING:
-                    continue
-                if not isinstance(field._default_factory, MISSING_TYPE):
-                    continue
-                return False
-            return True
+        # chz objects are frozen, so a shared sub-object (e.g. a diamond dependency)
+        # only needs to be canonicalized once per hash computation. Each entry keeps
+        # its object alive: configs rebuilt from dicts are temporaries, and a freed
+        # object's id can be reused by the next one.
+        canonical_by_id: dict[int, tuple[object, JsonValue]] = {}
 
         def canonicalize(item: object) -> JsonValue:
+            # Most leaves are plain scalars; skip the isinstance chain for them.
+            if type(item) in _SCALAR_TYPES:
+                return item
+
             if isinstance(item, _FuruMissing):
                 raise ValueError("Cannot hash Furu.MISSING")
 
             if chz.is_chz(item):
-                fields = chz.chz_fields(item)
+                cached = canonical_by_id.get(id(item))
+                if cached is not None:
+                    return cached[1]
+                names, provides_dependency_hashes = _hashed_fields(type(item))
                 result = {
                     "__class__": cls.get_classname(item),
-                    **{
-                        name: canonicalize(getattr(item, name))
-                        for name in fields
-                        if not name.startswith("_")
-                    },
+                    **{name: canonicalize(getattr(item, name)) for name in names},
                 }
-                if isinstance(item, _DependencyHashProvider):
-                    dependency_hashes = list(item._dependency_hashes())
+                if provides_dependency_hashes:
+                    provider = cast(_DependencyHashProvider, item)
+                    dependency_hashes = list(provider._dependency_hashes())
                     if dependency_hashes:
                         result["__dependencies__"] = dependency_hashes
+                canonical_by_id[id(item)] = (item, result)
                 return result
 
             if isinstance(item, dict):
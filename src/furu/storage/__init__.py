@@ -12,6 +12,7 @@ from .state import (
     StateAttempt,
     StateManager,
     StateOwner,
+    clear_state_cache,
     compute_lock,
 )
 
@@ -28,5 +29,6 @@ __all__ = [
     "StateManager",
     "StateOwner",
     "clear_metadata_cache",
+    "clear_state_cache",
     "compute_lock",
 ]
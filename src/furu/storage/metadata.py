@@ -1,18 +1,16 @@
 import datetime
-import getpass
-import json
 import os
 import platform
-import socket
 import subprocess
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pydantic_core
 from pydantic import BaseModel, ConfigDict
 
 from ..config import FURU_CONFIG
-from ..serialization import BaseModel as PydanticBaseModel
+from ..runtime.env import hostname, username
 from ..serialization import FuruSerializer
 from ..serialization.serializer import JsonValue
 
@@ -220,8 +218,8 @@ class MetadataManager:
             python_version=sys.version,
             executable=sys.executable,
             platform=platform.platform(),
-            hostname=socket.gethostname(),
-            user=getpass.getuser(),
+            hostname=hostname(),
+            user=username(),
             pid=os.getpid(),
         )
 
@@ -242,7 +240,7 @@ class MetadataManager:
         return FuruMetadata(
             furu_python_def=FuruSerializer.to_python(furu_obj, multiline=False),
             furu_obj=serialized_obj,
-            furu_hash=FuruSerializer.compute_hash(furu_obj),
+            furu_hash=furu_obj.furu_hash,
             furu_path=str(directory.resolve()),
             git_commit=git_info.git_commit,
             git_branch=git_info.git_branch,
@@ -263,15 +261,7 @@ class MetadataManager:
     def write_metadata(cls, metadata: FuruMetadata, directory: Path) -> None:
         """Write metadata to file."""
         metadata_path = cls.get_metadata_path(directory)
-        metadata_path.write_text(
-            json.dumps(
-                metadata.model_dump(mode="json"),
-                indent=2,
-                default=lambda o: o.model_dump()
-                if PydanticBaseModel is not None and isinstance(o, PydanticBaseModel)
-                else str(o),
-            )
-        )
+        metadata_path.write_text(metadata.model_dump_json(indent=2, ensure_ascii=True))
 
     @classmethod
     def read_metadata(cls, directory: Path) -> FuruMetadata:
@@ -279,8 +269,7 @@ class MetadataManager:
         metadata_path = cls.get_metadata_path(directory)
         if not metadata_path.is_file():
             raise FileNotFoundError(f"Metadata not found: {metadata_path}")
-        data = json.loads(metadata_path.read_text())
-        return FuruMetadata.model_validate(data)
+        return FuruMetadata.model_validate_json(metadata_path.read_bytes())
 
     @classmethod
     def read_metadata_raw(cls, directory: Path) -> dict[str, JsonValue] | None:
@@ -288,4 +277,4 @@ class MetadataManager:
         metadata_path = cls.get_metadata_path(directory)
         if not metadata_path.is_file():
             return None
-        return json.loads(metadata_path.read_text())
+        return pydantic_core.from_json(metadata_path.read_bytes())
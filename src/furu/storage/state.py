@@ -1,19 +1,23 @@
 import datetime as _dt
+import heapq
+import itertools
 import json
 import os
-import socket
 import threading
 import time
 import uuid
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Any, Callable, Literal, Mapping, TypeAlias, TypedDict
 
+import pydantic_core
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from ..errors import FuruLockNotAcquired, FuruWaitTimeout
+from ..runtime.env import hostname
+from .watch import wait_for_change
 
 # Type alias for scheduler-specific metadata. Different schedulers (SLURM, LSF, PBS, local)
 # return different fields, so this must remain dynamic.
@@ -25,6 +29,10 @@ ProbeResult = dict[str, Any]
 EventValue: TypeAlias = str | int | float | bool
 EventMapping: TypeAlias = Mapping[str, EventValue]
 
+# Identity of a state file on disk: (inode, size, mtime_ns). State writes always go
+# through `os.replace`, so every write produces a new inode.
+type _StateFileKey = tuple[int, int, int]
+
 
 class _LockInfoDict(TypedDict, total=False):
     """TypedDict for lock file information."""
@@ -58,7 +66,12 @@ class _ErrorDict(TypedDict, total=False):
 
 
 class _StateResultBase(BaseModel):
-    model_config = ConfigDict(extra="forbid", validate_assignment=True, strict=True)
+    model_config = ConfigDict(
+        extra="forbid",
+        validate_assignment=True,
+        strict=True,
+        ser_json_inf_nan="constants",
+    )
 
 
 class _StateResultAbsent(_StateResultBase):
@@ -118,7 +131,12 @@ def _coerce_result(current: _StateResult, **updates: str) -> _StateResult:
 class StateOwner(BaseModel):
     """Owner information for a Furu attempt."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True, strict=True)
+    model_config = ConfigDict(
+        extra="forbid",
+        validate_assignment=True,
+        strict=True,
+        ser_json_inf_nan="constants",
+    )
 
     pid: int | None = None
     host: str | None = None
@@ -152,7 +170,12 @@ class StateOwner(BaseModel):
 class FuruErrorState(BaseModel):
     """Error state information for a Furu attempt."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True, strict=True)
+    model_config = ConfigDict(
+        extra="forbid",
+        validate_assignment=True,
+        strict=True,
+        ser_json_inf_nan="constants",
+    )
 
     type: str = "UnknownError"
     message: str = ""
@@ -160,7 +183,12 @@ class FuruErrorState(BaseModel):
 
 
 class _StateAttemptBase(BaseModel):
-    model_config = ConfigDict(extra="forbid", validate_assignment=True, strict=True)
+    model_config = ConfigDict(
+        extra="forbid",
+        validate_assignment=True,
+        strict=True,
+        ser_json_inf_nan="constants",
+    )
 
     id: str
     number: int = 1
@@ -219,7 +247,7 @@ class StateAttempt(BaseModel):
     All fields that may not be present on all attempt types are optional.
     """
 
-    model_config = ConfigDict(extra="forbid", strict=True)
+    model_config = ConfigDict(extra="forbid", strict=True, ser_json_inf_nan="constants")
 
     id: str
     number: int
@@ -254,7 +282,12 @@ class StateAttempt(BaseModel):
 
 
 class _FuruState(BaseModel):
-    model_config = ConfigDict(extra="forbid", validate_assignment=True, strict=True)
+    model_config = ConfigDict(
+        extra="forbid",
+        validate_assignment=True,
+        strict=True,
+        ser_json_inf_nan="constants",
+    )
 
     schema_version: int = 1
     result: _StateResult = Field(
@@ -264,6 +297,17 @@ class _FuruState(BaseModel):
     updated_at: str | None = None
 
 
+# Process-local cache of parsed state files, keyed by path (see `StateManager.read_state`).
+_state_cache: dict[Path, tuple[_StateFileKey, _FuruState]] = {}
+_state_cache_lock = threading.Lock()
+
+
+def clear_state_cache() -> None:
+    """Clear the cached parsed state files. Useful for testing or long-running processes."""
+    with _state_cache_lock:
+        _state_cache.clear()
+
+
 class StateManager:
     """
     Crash-safe state and liveness management for a single Furu artifact directory.
@@ -286,6 +330,11 @@ class StateManager:
     SUBMIT_LOCK = "submit.lock"
     STATE_LOCK = "state.lock"
 
+    # Files modified more recently than this are never served from the state cache,
+    # since a same-size rewrite within one mtime tick would be indistinguishable.
+    STATE_CACHE_RACY_WINDOW_SEC = 2.0
+    STATE_CACHE_MAX_ENTRIES = 4096
+
     TERMINAL_STATUSES = {
         "success",
         "failed",
@@ -306,19 +355,21 @@ class StateManager:
 
     @classmethod
     def get_state_path(cls, directory: Path) -> Path:
-        return cls.get_internal_dir(directory) / cls.STATE_FILE
+        # joinpath builds one Path instead of two intermediate ones; these getters
+        # run several times per get().
+        return directory.joinpath(cls.INTERNAL_DIR, cls.STATE_FILE)
 
     @classmethod
     def get_events_path(cls, directory: Path) -> Path:
-        return cls.get_internal_dir(directory) / cls.EVENTS_FILE
+        return directory.joinpath(cls.INTERNAL_DIR, cls.EVENTS_FILE)
 
     @classmethod
     def get_success_marker_path(cls, directory: Path) -> Path:
-        return cls.get_internal_dir(directory) / cls.SUCCESS_MARKER
+        return directory.joinpath(cls.INTERNAL_DIR, cls.SUCCESS_MARKER)
 
     @classmethod
     def get_lock_path(cls, directory: Path, lock_name: str) -> Path:
-        return cls.get_internal_dir(directory) / lock_name
+        return directory.joinpath(cls.INTERNAL_DIR, lock_name)
 
     @classmethod
     def _utcnow(cls) -> _dt.datetime:
@@ -343,14 +394,43 @@ class StateManager:
 
     @classmethod
     def read_state(cls, directory: Path) -> _FuruState:
+        """
+        Read the state for `directory`, reusing the parsed state when the file is unchanged.
+
+        The returned state may be shared with other callers and must not be mutated;
+        use `update_state` to change it.
+        """
         state_path = cls.get_state_path(directory)
-        if not state_path.is_file():
+        try:
+            stat_result = os.stat(state_path)
+        except FileNotFoundError:
+            with _state_cache_lock:
+                _state_cache.pop(state_path, None)
             return cls.default_state()
 
-        text = state_path.read_text()
+        key = (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+        cached = _state_cache.get(state_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        state = cls._load_state(state_path)
+        racy_after_ns = time.time_ns() - int(cls.STATE_CACHE_RACY_WINDOW_SEC * 1e9)
+        with _state_cache_lock:
+            if stat_result.st_mtime_ns >= racy_after_ns:
+                _state_cache.pop(state_path, None)
+                return state
+            if len(_state_cache) >= cls.STATE_CACHE_MAX_ENTRIES:
+                _state_cache.pop(next(iter(_state_cache)))
+            _state_cache[state_path] = (key, state)
+        return state
+
+    @classmethod
+    def _load_state(cls, state_path: Path) -> _FuruState:
+        if not state_path.is_file():
+            return cls.default_state()
 
         try:
-            data = json.loads(text)
+            data = pydantic_core.from_json(state_path.read_bytes())
         except Exception as e:
             raise ValueError(f"Invalid JSON in state file: {state_path}") from e
 
@@ -368,9 +448,11 @@ class StateManager:
     @classmethod
     def _write_state_unlocked(cls, directory: Path, state: _FuruState) -> None:
         state_path = cls.get_state_path(directory)
-        tmp_path = state_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(state.model_dump(mode="json"), indent=2))
+        tmp_path = state_path.with_name(f"{state_path.name}.tmp-{uuid.uuid4().hex}")
+        tmp_path.write_text(state.model_dump_json(indent=2, ensure_ascii=True))
         os.replace(tmp_path, state_path)
+        with _state_cache_lock:
+            _state_cache.pop(state_path, None)
 
     @classmethod
     def _pid_alive(cls, pid: int) -> bool:
@@ -389,7 +471,7 @@ class StateManager:
             fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o644)
             payload = {
                 "pid": os.getpid(),
-                "host": socket.gethostname(),
+                "host": hostname(),
                 "created_at": cls._iso_now(),
                 "lock_id": uuid.uuid4().hex,
             }
@@ -461,7 +543,7 @@ class StateManager:
 
             should_break = False
             info = cls._read_lock_info(lock_path)
-            if info and info.get("host") == socket.gethostname():
+            if info and info.get("host") == hostname():
                 pid = info.get("pid")
                 if isinstance(pid, int) and not cls._pid_alive(pid):
                     should_break = True
@@ -481,7 +563,7 @@ class StateManager:
 
             if time.time() >= deadline:
                 raise TimeoutError(f"Timeout acquiring lock: {lock_path}")
-            time.sleep(0.05)
+            cls.wait_for_lock_release(lock_path, 0.05)
 
     @classmethod
     def update_state(
@@ -493,7 +575,8 @@ class StateManager:
             fd = cls._acquire_lock_blocking(lock_path)
             state_path = cls.get_state_path(directory)
             force_write = not state_path.is_file()
-            state = cls.read_state(directory)
+            # Bypass the read cache: the mutator needs a private, up-to-date copy.
+            state = cls._load_state(state_path)
             changed = mutator(state)
             if force_write or changed is not False:
                 state.schema_version = cls.SCHEMA_VERSION
@@ -511,7 +594,7 @@ class StateManager:
         enriched = {
             "ts": cls._iso_now(),
             "pid": os.getpid(),
-            "host": socket.gethostname(),
+            "host": hostname(),
             **event,
         }
         with path.open("a", encoding="utf-8") as f:
@@ -521,7 +604,7 @@ class StateManager:
     def write_success_marker(cls, directory: Path, *, attempt_id: str) -> None:
         marker = cls.get_success_marker_path(directory)
         payload = {"attempt_id": attempt_id, "created_at": cls._iso_now()}
-        tmp = marker.with_suffix(".tmp")
+        tmp = marker.with_name(f"{marker.name}.tmp-{uuid.uuid4().hex}")
         tmp.write_text(json.dumps(payload, indent=2))
         os.replace(tmp, marker)
 
@@ -680,6 +763,76 @@ class StateManager:
             raise RuntimeError("start_attempt did not create attempt")
         return attempt.id
 
+    @classmethod
+    def wait_for_change(
+        cls,
+        directory: Path,
+        timeout_sec: float,
+        until: Callable[[], bool] | None = None,
+    ) -> None:
+        """Block until the state file or compute lock changes, or `timeout_sec` passes."""
+        cls.wait_for_any_change((directory,), timeout_sec, until)
+
+    @classmethod
+    def wait_for_any_change(
+        cls,
+        directories: Sequence[Path],
+        timeout_sec: float,
+        until: Callable[[], bool] | None = None,
+    ) -> None:
+        """Block until the state file or compute lock of any of `directories` changes."""
+        wait_for_change(
+            [cls.get_internal_dir(directory) for directory in directories],
+            (cls.STATE_FILE, cls.COMPUTE_LOCK),
+            timeout_sec,
+            until,
+        )
+
+    @classmethod
+    def wait_for_lock_release(
+        cls,
+        lock_path: Path,
+        timeout_sec: float,
+        *,
+        ready_file: Path | None = None,
+    ) -> None:
+        """
+        Block until `lock_path` is released, or `timeout_sec` passes.
+
+        If `ready_file` (a file next to the lock) is given, also return as soon as it
+        is created or replaced, even while the lock is still held.
+        """
+
+        def file_key(path: Path) -> tuple[int, int] | None:
+            try:
+                stat_result = path.stat()
+            except FileNotFoundError:
+                return None
+            return (stat_result.st_ino, stat_result.st_mtime_ns)
+
+        names = [lock_path.name]
+        initial_ready_key: tuple[int, int] | None = None
+        if ready_file is not None:
+            names.append(ready_file.name)
+            initial_ready_key = file_key(ready_file)
+
+        def done() -> bool:
+            if not lock_path.exists():
+                return True
+            return ready_file is not None and file_key(ready_file) != initial_ready_key
+
+        # Re-check between short, growing waits: a release that lands before the
+        # watch is installed, or on a filesystem without inotify events, is then
+        # noticed within the current step instead of after the full timeout.
+        deadline = time.monotonic() + timeout_sec
+        step_sec = 0.01
+        while not done():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            wait_for_change((lock_path.parent,), names, min(step_sec, remaining), done)
+            step_sec = min(step_sec * 2, 0.5)
+
     @classmethod
     def heartbeat(cls, directory: Path) -> None:
         lock_path = cls.get_lock_path(directory, cls.COMPUTE_LOCK)
@@ -796,7 +949,7 @@ class StateManager:
     ) -> bool | None:
         host = attempt.owner.host
         pid = attempt.owner.pid
-        if host != socket.gethostname():
+        if host != hostname():
             return None
         if not isinstance(pid, int):
             return None
@@ -968,6 +1121,69 @@ class StateManager:
         return state
 
 
+class _HeartbeatScheduler:
+    """Touch the heartbeat of every held compute lock from one shared daemon thread."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._deadlines: list[tuple[float, int]] = []
+        self._entries: dict[int, tuple[Path, float]] = {}
+        self._tokens = itertools.count()
+        self._thread: threading.Thread | None = None
+
+    def register(self, directory: Path, interval_sec: float) -> int:
+        with self._condition:
+            token = next(self._tokens)
+            self._entries[token] = (directory, interval_sec)
+            heapq.heappush(self._deadlines, (time.monotonic() + interval_sec, token))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="furu-heartbeat", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return token
+
+    def unregister(self, token: int) -> None:
+        # Heartbeats are touched while holding the condition, so once this returns
+        # the directory is never touched again. Stale deadlines are dropped lazily.
+        with self._condition:
+            self._entries.pop(token, None)
+
+    def _reset_after_fork(self) -> None:
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._entries = {}
+        self._thread = None
+
+    def _run(self) -> None:
+        with self._condition:
+            while True:
+                while self._deadlines and self._deadlines[0][1] not in self._entries:
+                    heapq.heappop(self._deadlines)
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+                deadline, token = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._deadlines)
+                directory, interval_sec = self._entries[token]
+                # The lock file may have vanished (e.g. broken by reconcile); keep
+                # serving the other locks and let lease expiry handle this one.
+                with suppress(OSError):
+                    StateManager.heartbeat(directory)
+                heapq.heappush(
+                    self._deadlines, (time.monotonic() + interval_sec, token)
+                )
+
+
+_heartbeats = _HeartbeatScheduler()
+os.register_at_fork(after_in_child=_heartbeats._reset_after_fork)
+
+
 @dataclass
 class ComputeLockContext:
     """Context returned when a compute lock is successfully acquired."""
@@ -988,7 +1204,7 @@ def compute_lock(
     max_wait_time_sec: float | None = None,
     poll_interval_sec: float = 10.0,
     wait_log_every_sec: float = 10.0,
-    reconcile_fn: Callable[[Path], None] | None = None,
+    reconcile_fn: Callable[[Path], _FuruState | None] | None = None,
     allow_failed: bool = False,
     allow_success: bool = False,
 ) -> Generator[ComputeLockContext, None, None]:
@@ -1011,9 +1227,11 @@ def compute_lock(
         owner: Owner information (pid, host, user, etc.)
         scheduler: Optional scheduler metadata
         max_wait_time_sec: Maximum time to wait for lock (None = wait forever)
-        poll_interval_sec: Interval between lock acquisition attempts
+        poll_interval_sec: Maximum interval between lock acquisition attempts; waits
+            end early when the state file or lock changes
         wait_log_every_sec: Interval between "waiting for lock" log messages
-        reconcile_fn: Optional function to call to reconcile stale attempts
+        reconcile_fn: Optional function to call to reconcile stale attempts; if it
+            returns the reconciled state, the state file is not read again
         allow_failed: Allow recomputation even if state is failed
         allow_success: Allow recomputation even if state is successful
 
@@ -1141,8 +1359,9 @@ def compute_lock(
                 StateManager.release_lock(lock_fd, lock_path)
                 lock_fd = None
                 if reconcile_fn is not None:
-                    reconcile_fn(directory)
-                    state = StateManager.read_state(directory)
+                    state = reconcile_fn(directory) or StateManager.read_state(
+                        directory
+                    )
                 if isinstance(state.result, _StateResultSuccess) and not allow_success:
                     raise FuruLockNotAcquired(
                         "Cannot acquire lock: experiment already succeeded"
@@ -1165,15 +1384,13 @@ def compute_lock(
                         _describe_wait(attempt, waited_sec),
                     )
                     next_wait_log_at = now + wait_log_every_sec
-                time.sleep(poll_interval_sec)
+                StateManager.wait_for_change(directory, poll_interval_sec)
                 continue
             break
 
         # Lock held by someone else - reconcile and check state
-        if reconcile_fn is not None:
-            reconcile_fn(directory)
-
-        state = StateManager.read_state(directory)
+        reconciled = reconcile_fn(directory) if reconcile_fn is not None else None
+        state = reconciled or StateManager.read_state(directory)
         attempt = state.attempt
 
         # If result is terminal, no point waiting
@@ -1207,10 +1424,14 @@ def compute_lock(
                 _describe_wait(attempt, waited_sec),
             )
             next_wait_log_at = now + wait_log_every_sec
-        time.sleep(poll_interval_sec)
+        # Re-check the lock once the watch is installed: a release between the
+        # failed try_lock above and the watch would otherwise cost a full interval.
+        StateManager.wait_for_change(
+            directory, poll_interval_sec, lambda: not lock_path.exists()
+        )
 
     # Lock acquired - now atomically record attempt and start heartbeat
-    stop_event = threading.Event()
+    heartbeat_token: int | None = None
     attempt_id: str | None = None
 
     try:
@@ -1224,18 +1445,15 @@ def compute_lock(
         )
 
         # Start heartbeat IMMEDIATELY
-        def heartbeat() -> None:
-            while not stop_event.wait(heartbeat_interval_sec):
-                StateManager.heartbeat(directory)
-
-        thread = threading.Thread(target=heartbeat, daemon=True)
-        thread.start()
+        token = _heartbeats.register(directory, heartbeat_interval_sec)
+        heartbeat_token = token
 
         yield ComputeLockContext(
             attempt_id=attempt_id,
-            stop_heartbeat=stop_event.set,
+            stop_heartbeat=lambda: _heartbeats.unregister(token),
         )
     finally:
         # Always stop heartbeat and release lock
-        stop_event.set()
+        if heartbeat_token is not None:
+            _heartbeats.unregister(heartbeat_token)
         StateManager.release_lock(lock_fd, lock_path)
@@ -0,0 +1,95 @@
+"""Wait for changes to files in a directory without busy polling."""
+
+import ctypes
+import functools
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Collection
+from pathlib import Path
+
+# inotify(7) event masks.
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@functools.cache
+def _inotify_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    libc = ctypes.CDLL(None, use_errno=True)
+    if not hasattr(libc, "inotify_init1") or not hasattr(libc, "inotify_add_watch"):
+        return None
+    return libc
+
+
+def _read_event_names(fd: int) -> list[bytes]:
+    data = os.read(fd, 64 * 1024)
+    names: list[bytes] = []
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+        start = offset + _EVENT_HEADER.size
+        names.append(data[start : start + length].rstrip(b"\0"))
+        offset = start + length
+    return names
+
+
+def wait_for_change(
+    directories: Collection[Path],
+    names: Collection[str],
+    timeout_sec: float,
+    until: Callable[[], bool] | None = None,
+) -> None:
+    """
+    Block until one of `names` in any of `directories` is written, replaced, created, or removed.
+
+    Uses inotify on Linux and falls back to sleeping for `timeout_sec` elsewhere.
+    Changes made before the watch is installed, in directories that do not exist
+    yet, or on filesystems that do not report events (e.g. NFS), are not seen, so
+    callers must re-check their condition after returning; the timeout doubles as
+    the polling fallback. `until`, if given, is checked once the watch is in place,
+    so a change that landed just before it returns immediately instead.
+    """
+    if timeout_sec <= 0:
+        return
+    libc = _inotify_libc()
+    if libc is None:
+        time.sleep(timeout_sec)
+        return
+
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        time.sleep(timeout_sec)
+        return
+    try:
+        watched = [
+            libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) >= 0
+            for directory in directories
+        ]
+        if not any(watched):
+            time.sleep(timeout_sec)
+            return
+        if until is not None and until():
+            return
+        wanted = {os.fsencode(name) for name in names}
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return
+            if any(name in wanted for name in _read_event_names(fd)):
+                return
+    finally:
+        os.close(fd)
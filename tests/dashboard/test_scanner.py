@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from furu.config import FURU_CONFIG
 from furu.dashboard.scanner import (
     get_experiment_dag,
     get_experiment_detail,
@@ -244,6 +245,20 @@ def test_scan_experiments_version_controlled(temp_furu_root: Path) -> None:
     assert expected_versioned in namespaces
 
 
+def test_scan_experiments_skips_artifacts_and_stray_internal_dirs(
+    temp_furu_root: Path,
+) -> None:
+    """Test that only directories with .furu/state.json are reported."""
+    dataset = PrepareDataset(name="test", version="v1")
+    directory = create_experiment_from_furu(dataset, result_status="success")
+    (directory / "checkpoints" / "epoch1").mkdir(parents=True)
+    (directory / "checkpoints" / "epoch1" / "weights.bin").write_bytes(b"")
+    (FURU_CONFIG.get_root(False) / "scratch" / ".furu").mkdir(parents=True)
+
+    experiments = scan_experiments()
+    assert [exp.furu_hash for exp in experiments] == [dataset.furu_hash]
+
+
 def test_experiment_summary_class_name(temp_furu_root: Path) -> None:
     """Test that class_name is correctly extracted from namespace."""
     dataset = PrepareDataset(name="test", version="v1")
@@ -263,6 +278,16 @@ def test_scan_experiments_filter_by_class(populated_furu_root: Path) -> None:
         assert exp.class_name == "TrainModel"
 
 
+def test_scan_experiments_filter_by_partial_namespace(
+    populated_furu_root: Path,
+) -> None:
+    """Test that a prefix ending mid-component still matches by string prefix."""
+    experiments = scan_experiments(namespace_prefix="dashboard.pipelines.Train")
+    assert {exp.class_name for exp in experiments} == {"TrainModel"}
+    assert scan_experiments(namespace_prefix="dashboard.missing.X") == []
+    assert scan_experiments(namespace_prefix="../../dashboard") == []
+
+
 # =============================================================================
 # Tests for new filtering features: backend, hostname, user, date range, config
 # =============================================================================
@@ -96,6 +96,23 @@ def test_version_controlled_root_missing_gitignore_ok(tmp_path, monkeypatch) ->
     assert root == project_root / "furu-data" / "artifacts"
 
 
+def test_version_controlled_root_is_resolved_once(tmp_path, monkeypatch) -> None:
+    project_root = tmp_path / "repo"
+    project_root.mkdir()
+    (project_root / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    elsewhere = tmp_path / "elsewhere"
+    (elsewhere / ".git").mkdir(parents=True)
+
+    monkeypatch.chdir(project_root)
+    monkeypatch.delenv("FURU_VERSION_CONTROLLED_PATH", raising=False)
+    config = FuruConfig()
+    root = config.get_root(version_controlled=True)
+
+    monkeypatch.chdir(elsewhere)
+    assert config.get_root(version_controlled=True) == root
+    assert root == project_root / "furu-data" / "artifacts"
+
+
 def test_version_controlled_root_override(tmp_path, monkeypatch) -> None:
     override_root = tmp_path / "override"
     monkeypatch.setenv("FURU_VERSION_CONTROLLED_PATH", str(override_root))
@@ -152,6 +169,26 @@ def test_retry_failed_defaults_true(monkeypatch) -> None:
     assert config.retry_failed is True
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1", True),
+        (" Yes ", True),
+        ("TRUE", True),
+        ("y", False),
+        ("on", False),
+        ("0", False),
+        ("off", False),
+    ],
+)
+def test_boolean_env_values(monkeypatch, value: str, expected: bool) -> None:
+    monkeypatch.setenv("FURU_RETRY_FAILED", value)
+    monkeypatch.setenv("FURU_CANCELLED_IS_PREEMPTED", value)
+    config = FuruConfig()
+    assert config.retry_failed is expected
+    assert config.cancelled_is_preempted is expected
+
+
 def test_record_git_invalid_value_raises(monkeypatch) -> None:
     monkeypatch.setenv("FURU_RECORD_GIT", "nope")
     with pytest.raises(ValueError, match="FURU_RECORD_GIT must be one of"):
@@ -34,6 +34,21 @@ class Flaky(furu.Furu[int]):
         return json.loads((self.furu_dir / "value.json").read_text())
 
 
+class PreemptedThenFails(furu.Furu[int]):
+    def _create(self) -> int:
+        attempt = furu.StateManager.read_state(self.furu_dir).attempt
+        assert attempt is not None
+        furu.StateManager.finish_attempt_preempted(
+            self.furu_dir,
+            attempt_id=attempt.id,
+            error={"type": "signal", "message": "signal:15"},
+        )
+        raise RuntimeError("interrupted")
+
+    def _load(self) -> int:
+        return json.loads((self.furu_dir / "never.json").read_text())
+
+
 class MetadataFails(furu.Furu[int]):
     def _create(self) -> int:
         value = 5
@@ -181,3 +196,14 @@ def test_get_recomputes_if_validate_returns_false(furu_tmp_root) -> None:
 
     assert obj.get() == 1
     assert (obj.furu_dir / "validated.txt").exists()
+
+
+def test_failure_after_preemption_keeps_preempted_attempt(furu_tmp_root) -> None:
+    obj = PreemptedThenFails()
+    with pytest.raises(RuntimeError, match="interrupted"):
+        obj.get()
+
+    state = furu.StateManager.read_state(obj.furu_dir)
+    assert not isinstance(state.result, _StateResultFailed)
+    assert state.attempt is not None
+    assert state.attempt.status == "preempted"
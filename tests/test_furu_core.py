@@ -4,6 +4,7 @@ import os
 import time
 
 import furu
+from furu.storage import MigrationManager
 from furu.storage.state import _StateResultSuccess
 
 
@@ -166,3 +167,103 @@ def test_get_waits_until_lease_expires_then_recovers(
     assert isinstance(
         furu.StateManager.read_state(directory).result, _StateResultSuccess
     )
+
+
+class UnannotatedField(furu.Furu[int]):
+    value = furu.chz.field(default=3)
+
+    def _create(self) -> int:
+        return self.value
+
+    def _load(self) -> int:
+        return self.value
+
+
+def test_unannotated_chz_field_is_materialized(furu_tmp_root) -> None:
+    assert UnannotatedField().value == 3
+    assert UnannotatedField(value=5).value == 5
+    assert "value" in UnannotatedField.__annotations__
+
+
+class ForwardReferenced(furu.Furu[int]):
+    # Annotated with a class that is only defined further down the module.
+    dependency: "LaterDependency" = furu.chz.field()
+
+    def _create(self) -> int:
+        return self.dependency.value
+
+    def _load(self) -> int:
+        return self.dependency.value
+
+
+class LaterDependency(furu.Furu[int]):
+    value: int = furu.chz.field(default=4)
+
+    def _create(self) -> int:
+        return self.value
+
+    def _load(self) -> int:
+        return self.value
+
+
+def test_forward_referenced_field_annotation(furu_tmp_root) -> None:
+    obj = ForwardReferenced(dependency=LaterDependency())
+    assert "dependency" in ForwardReferenced.__chz_fields__
+    assert obj.get() == 4
+
+
+def test_exists_skips_migration_record_when_success_marker_present(
+    furu_tmp_root, monkeypatch
+) -> None:
+    obj = Dummy()
+    obj.get()
+
+    def fail_read_migration(directory):
+        raise AssertionError(f"unexpected migration read for {directory}")
+
+    monkeypatch.setattr(MigrationManager, "read_migration", fail_read_migration)
+    assert obj.exists()
+
+
+def test_exists_on_missing_directory_does_not_read_state(
+    furu_tmp_root, monkeypatch
+) -> None:
+    def fail_read_state(directory):
+        raise AssertionError(f"unexpected state read for {directory}")
+
+    monkeypatch.setattr(furu.StateManager, "read_state", fail_read_state)
+    obj = Dummy()
+    assert not obj.exists()
+    assert not obj._base_furu_dir().exists()
+
+
+def test_furu_hash_is_computed_once_per_instance(furu_tmp_root, monkeypatch) -> None:
+    calls: list[furu.Furu] = []
+    compute_hash = furu.FuruSerializer.compute_hash
+
+    def counting_compute_hash(obj, verbose=False):
+        calls.append(obj)
+        return compute_hash(obj, verbose)
+
+    monkeypatch.setattr(furu.FuruSerializer, "compute_hash", counting_compute_hash)
+    obj = Dummy()
+    assert obj.get() == 123
+    assert obj.get() == 123
+    assert obj.exists()
+    _ = obj.furu_dir, obj.furu_hash, obj.get_metadata()
+
+    assert [c for c in calls if c is obj] == [obj]
+
+
+def test_get_success_fast_path_skips_internal_dir_creation(
+    furu_tmp_root, monkeypatch
+) -> None:
+    Dummy().get()
+
+    def fail_ensure_internal_dir(directory):
+        raise AssertionError(f"unexpected mkdir for {directory}")
+
+    monkeypatch.setattr(
+        furu.StateManager, "ensure_internal_dir", fail_ensure_internal_dir
+    )
+    assert Dummy().get() == 123
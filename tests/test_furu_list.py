@@ -1,4 +1,5 @@
 import json
+from typing import ClassVar
 
 import furu
 
@@ -28,3 +29,75 @@ def test_collection_dedup_and_lookup(furu_tmp_root) -> None:
     assert Experiments.by_name("a").value == 1
     assert Experiments.by_name("x").value == 2
     assert Experiments.by_name("missing", strict=False) is None
+
+
+shared = Exp(value=3)
+
+
+class SharedExperiments(furu.FuruList[Exp]):
+    first = shared
+    second = shared
+    grouped: ClassVar[dict[str, Exp]] = {"third": shared}
+
+
+def test_collection_dedups_shared_instances(furu_tmp_root) -> None:
+    assert SharedExperiments.all() == [shared]
+    assert SharedExperiments.by_name("third") is shared
+
+
+def test_collection_entries_cache_invalidated_on_assignment(furu_tmp_root) -> None:
+    class Growing(furu.FuruList[Exp]):
+        a = Exp(value=10)
+
+    assert [e.value for e in Growing] == [10]
+    assert Growing.all() is not Growing.all()
+
+    Growing.b = Exp(value=11)
+    assert sorted(e.value for e in Growing) == [10, 11]
+
+    del Growing.a
+    assert [e.value for e in Growing.all()] == [11]
+
+
+def test_collection_by_name_prefers_top_level_and_tracks_assignment(
+    furu_tmp_root,
+) -> None:
+    class Named(furu.FuruList[Exp]):
+        x = Exp(value=20)
+        group: ClassVar[dict[str, Exp]] = {"x": Exp(value=21), "y": Exp(value=22)}
+        other: ClassVar[dict[str, Exp]] = {"y": Exp(value=23)}
+
+    assert Named.by_name("x").value == 20
+    assert Named.by_name("y").value == 22
+
+    Named.z = Exp(value=24)
+    assert Named.by_name("z").value == 24
+
+
+def test_collection_sees_nested_changes_only_after_reassignment(
+    furu_tmp_root,
+) -> None:
+    class Grouped(furu.FuruList[Exp]):
+        group: ClassVar[dict[str, Exp]] = {"x": Exp(value=30)}
+
+    assert [e.value for e in Grouped] == [30]
+    assert Grouped.by_name("x").value == 30
+
+    Grouped.group["y"] = Exp(value=31)
+    assert [e.value for e in Grouped] == [30]
+    assert Grouped.by_name("y", strict=False) is None
+
+    Grouped.group = dict(Grouped.group)
+    assert sorted(e.value for e in Grouped) == [30, 31]
+    assert Grouped.by_name("y").value == 31
+
+
+def test_collection_exists_all(furu_tmp_root) -> None:
+    done = Experiments.by_name("a")
+    done.get()
+
+    status = Experiments.exists_all(max_workers=2)
+    assert status == {
+        done.furu_hash: True,
+        Experiments.by_name("x").furu_hash: False,
+    }
@@ -1,4 +1,5 @@
 import datetime
+import enum
 import importlib
 import pathlib
 from pathlib import Path
@@ -69,3 +70,52 @@ def test_to_python_is_evaluable() -> None:
 def test_missing_is_not_serializable() -> None:
     with pytest.raises(ValueError, match="MISSING"):
         furu.FuruSerializer.to_dict(furu.MISSING)
+
+
+def test_compute_hash_shared_subobject_matches_distinct_copies() -> None:
+    shared = Foo(a=1, p=Path("x/y"))
+    with_shared = {"left": shared, "right": shared}
+    with_copies = {"left": Foo(a=1, p=Path("x/y")), "right": Foo(a=1, p=Path("x/y"))}
+    assert furu.FuruSerializer.compute_hash(
+        with_shared
+    ) == furu.FuruSerializer.compute_hash(with_copies)
+
+
+def test_compute_hash_is_stable() -> None:
+    # Hashes name artifact directories on disk; changing the canonical form or the
+    # digest function silently orphans every existing result.
+    obj = Foo(a=1, p=Path("x/y"))
+    data = {"b": b"raw", "n": [1, 2.5, None, True]}
+    assert furu.FuruSerializer.compute_hash(obj) == "a52a8b283dc44b71c936"
+    assert furu.FuruSerializer.compute_hash(data) == "03de6c8efeb228012b50"
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+
+
+def test_compute_hash_keeps_scalar_subclasses_distinct() -> None:
+    # IntEnum members are ints, but must not hash like the plain value.
+    assert furu.FuruSerializer.compute_hash(
+        [Level.LOW]
+    ) != furu.FuruSerializer.compute_hash([1])
+
+
+class Indexed(furu.Furu[int]):
+    index: int = furu.chz.field()
+
+    def _create(self) -> int:
+        return self.index
+
+    def _load(self) -> int:
+        return self.index
+
+
+def test_compute_hash_of_serialized_configs_matches_live_objects() -> None:
+    # Serialized configs are rebuilt into short-lived objects while hashing; a
+    # recycled object id must not pick up another config's canonical form.
+    tasks = [Indexed(index=i) for i in range(20)]
+    configs = [furu.FuruSerializer.to_dict(task) for task in tasks]
+    assert furu.FuruSerializer.compute_hash(
+        configs
+    ) == furu.FuruSerializer.compute_hash(tasks)
@@ -143,6 +143,54 @@ def test_submit_slurm_dag_wires_dependencies(furu_tmp_root, monkeypatch) -> None
     }
 
 
+def test_submit_slurm_dag_shares_executor_for_independent_nodes(
+    furu_tmp_root, monkeypatch
+) -> None:
+    leaves = [DagTask(name="leaf-a"), DagTask(name="leaf-b")]
+    root = DagTask(name="root", deps=leaves)
+
+    specs = {"default": SlurmSpec(partition="cpu", cpus=2, mem_gb=4, time_min=10)}
+    executors: list[FakeExecutor] = []
+
+    def fake_make_executor(
+        spec_key: str,
+        spec: SlurmSpec,
+        *,
+        kind: str,
+        submitit_root,
+        run_id: str | None = None,
+    ):
+        executor = FakeExecutor(folder=f"{kind}:{spec_key}")
+        executors.append(executor)
+        return executor
+
+    submitted_with: dict[str, FakeExecutor] = {}
+
+    def fake_submit_once(self, adapter, directory, on_job_id, *, allow_failed):
+        submitted_with[self.name] = adapter.executor
+        furu.StateManager.ensure_internal_dir(directory)
+        furu.StateManager.start_attempt_queued(
+            directory,
+            backend="submitit",
+            lease_duration_sec=furu.FURU_CONFIG.lease_duration_sec,
+            owner={"pid": 99999, "host": "other-host", "user": "x"},
+            scheduler={"job_id": f"job-{self.name}"},
+        )
+        return FakeJob(f"job-{self.name}")
+
+    monkeypatch.setattr(
+        "furu.execution.slurm_dag.make_executor_for_spec", fake_make_executor
+    )
+    monkeypatch.setattr(DagTask, "_submit_once", fake_submit_once)
+
+    submit_slurm_dag([root], specs=specs, submitit_root=None)
+
+    assert len(executors) == 2
+    assert submitted_with["leaf-a"] is submitted_with["leaf-b"]
+    assert submitted_with["root"] is not submitted_with["leaf-a"]
+    assert "slurm_additional_parameters" not in submitted_with["leaf-a"].parameters
+
+
 def test_submit_slurm_dag_uses_in_progress_job_ids(furu_tmp_root, monkeypatch) -> None:
     dep = DagTask(name="dep")
     root = DagTask(name="root", deps=[dep])
@@ -451,3 +499,49 @@ def test_job_id_for_in_progress_fails_fast_on_terminal_failed_dependency(
 
     with pytest.raises(furu.FuruExecutionError, match="became terminal"):
         _job_id_for_in_progress(obj)
+
+
+class FakeSubmitAdapter:
+    def __init__(self) -> None:
+        self.submitted = 0
+
+    def load_job(self, directory):
+        return None
+
+    def submit(self, fn):
+        self.submitted += 1
+        return FakeJob(f"job-{self.submitted}")
+
+    def pickle_job(self, job, directory) -> None:
+        return None
+
+    def watch_job_id(self, job, directory, *, attempt_id, callback=None) -> None:
+        return None
+
+
+def test_submit_once_reuses_existing_metadata(furu_tmp_root, monkeypatch) -> None:
+    obj = DagTask(name="resubmit")
+    directory = obj._base_furu_dir()
+    adapter = FakeSubmitAdapter()
+    calls: list[str] = []
+    create_metadata = furu.MetadataManager.create_metadata
+
+    def counting_create_metadata(furu_obj, directory, ignore_diff=False):
+        calls.append(furu_obj.furu_hash)
+        return create_metadata(furu_obj, directory, ignore_diff)
+
+    monkeypatch.setattr(
+        furu.MetadataManager, "create_metadata", counting_create_metadata
+    )
+
+    obj._submit_once(adapter, directory, None, allow_failed=True)
+    assert furu.MetadataManager.get_metadata_path(directory).is_file()
+
+    def mark_preempted(state) -> None:
+        state.attempt = None
+
+    furu.StateManager.update_state(directory, mark_preempted)
+    obj._submit_once(adapter, directory, None, allow_failed=True)
+
+    assert adapter.submitted == 2
+    assert calls == [obj.furu_hash]
@@ -1,5 +1,7 @@
 import json
+import os
 import socket
+import sys
 from pathlib import Path
 import threading
 import time
@@ -40,6 +42,65 @@ def test_state_default_and_attempt_lifecycle(furu_tmp_root, tmp_path) -> None:
     assert state1.updated_at is not None
 
 
+def test_state_file_round_trips_non_finite_floats(furu_tmp_root, tmp_path) -> None:
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    furu.StateManager.start_attempt_running(
+        directory,
+        backend="local",
+        lease_duration_sec=60.0,
+        owner={"pid": 99999, "host": "other-host", "user": "x"},
+    )
+
+    def make_lease_infinite(state) -> None:
+        assert state.attempt is not None
+        state.attempt.lease_duration_sec = float("inf")
+
+    furu.StateManager.update_state(directory, make_lease_infinite)
+
+    state_path = furu.StateManager.get_state_path(directory)
+    assert '"lease_duration_sec": Infinity' in state_path.read_text()
+    attempt = furu.StateManager.read_state(directory).attempt
+    assert attempt is not None
+    assert attempt.lease_duration_sec == float("inf")
+
+
+def test_concurrent_state_writers_use_private_temp_files(
+    furu_tmp_root, tmp_path
+) -> None:
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    attempt_id = furu.StateManager.start_attempt_running(
+        directory,
+        backend="local",
+        lease_duration_sec=60.0,
+        owner={"pid": 99999, "host": "other-host", "user": "x"},
+    )
+
+    # The success marker is written without the state lock, so writers must not
+    # share a temp path.
+    errors: list[BaseException] = []
+
+    def write_marker() -> None:
+        for _ in range(20):
+            try:
+                furu.StateManager.write_success_marker(directory, attempt_id=attempt_id)
+            except OSError as exc:
+                errors.append(exc)
+
+    writers = [threading.Thread(target=write_marker) for _ in range(8)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    assert errors == []
+    furu.StateManager.finish_attempt_success(directory, attempt_id=attempt_id)
+
+    internal_dir = furu.StateManager.get_internal_dir(directory)
+    assert not [path.name for path in internal_dir.iterdir() if ".tmp" in path.name]
+    assert furu.StateManager.success_marker_exists(directory)
+
+
 def test_locks_are_exclusive(furu_tmp_root, tmp_path) -> None:
     directory = tmp_path / "obj"
     furu.StateManager.ensure_internal_dir(directory)
@@ -662,9 +723,283 @@ def test_compute_lock_heartbeat_runs(furu_tmp_root, tmp_path) -> None:
         lock_path = furu.StateManager.get_lock_path(
             directory, furu.StateManager.COMPUTE_LOCK
         )
+        state_path = furu.StateManager.get_state_path(directory)
         initial_mtime = lock_path.stat().st_mtime
+        initial_state_stat = state_path.stat()
 
         time.sleep(0.2)
 
         updated_mtime = lock_path.stat().st_mtime
         assert updated_mtime > initial_mtime
+        # Heartbeats only touch the lock file; the state file is not rewritten.
+        updated_state_stat = state_path.stat()
+        assert updated_state_stat.st_ino == initial_state_stat.st_ino
+        assert updated_state_stat.st_mtime_ns == initial_state_stat.st_mtime_ns
+
+
+def test_compute_locks_share_one_heartbeat_thread(furu_tmp_root, tmp_path) -> None:
+    directories = [tmp_path / "a", tmp_path / "b"]
+    for directory in directories:
+        furu.StateManager.ensure_internal_dir(directory)
+    lock_paths = [
+        furu.StateManager.get_lock_path(directory, furu.StateManager.COMPUTE_LOCK)
+        for directory in directories
+    ]
+
+    with (
+        compute_lock(
+            directories[0],
+            backend="local",
+            lease_duration_sec=0.5,
+            heartbeat_interval_sec=0.05,
+            owner={"pid": 12345, "host": "test-host", "user": "test-user"},
+        ) as first,
+        compute_lock(
+            directories[1],
+            backend="local",
+            lease_duration_sec=0.5,
+            heartbeat_interval_sec=0.05,
+            owner={"pid": 12345, "host": "test-host", "user": "test-user"},
+        ),
+    ):
+        heartbeat_threads = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == "furu-heartbeat"
+        ]
+        assert len(heartbeat_threads) == 1
+
+        initial = [path.stat().st_mtime_ns for path in lock_paths]
+        time.sleep(0.2)
+        assert all(
+            path.stat().st_mtime_ns > mtime for path, mtime in zip(lock_paths, initial)
+        )
+
+        first.stop_heartbeat()
+        stopped = lock_paths[0].stat().st_mtime_ns
+        running = lock_paths[1].stat().st_mtime_ns
+        time.sleep(0.2)
+        assert lock_paths[0].stat().st_mtime_ns == stopped
+        assert lock_paths[1].stat().st_mtime_ns > running
+
+
+def test_read_state_reuses_parsed_state_until_file_changes(
+    furu_tmp_root, tmp_path
+) -> None:
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    furu.StateManager.start_attempt_running(
+        directory,
+        backend="local",
+        lease_duration_sec=60.0,
+        owner={"pid": 99999, "host": socket.gethostname(), "user": "x"},
+        scheduler={},
+    )
+    state_path = furu.StateManager.get_state_path(directory)
+
+    # Freshly written files are inside the racy window and are always re-parsed.
+    assert furu.StateManager.read_state(directory) is not furu.StateManager.read_state(
+        directory
+    )
+
+    old = time.time() - 60.0
+    os.utime(state_path, (old, old))
+    first = furu.StateManager.read_state(directory)
+    assert furu.StateManager.read_state(directory) is first
+
+    def mutate(state: _FuruState) -> None:
+        state.result = _StateResultAbsent(status="absent")
+
+    furu.StateManager.update_state(directory, mutate)
+    after = furu.StateManager.read_state(directory)
+    assert after is not first
+    assert isinstance(after.result, _StateResultAbsent)
+    assert isinstance(first.result, _StateResultIncomplete)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only")
+def test_compute_lock_wakes_on_lock_release_before_poll_interval(
+    furu_tmp_root, tmp_path
+) -> None:
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    furu.StateManager.start_attempt_running(
+        directory,
+        backend="local",
+        lease_duration_sec=60.0,
+        owner={"pid": 99999, "host": "other-host", "user": "other-user"},
+    )
+    lock_path = furu.StateManager.get_lock_path(
+        directory, furu.StateManager.COMPUTE_LOCK
+    )
+    lock_fd = furu.StateManager.try_lock(lock_path)
+    assert lock_fd is not None
+
+    def release_later() -> None:
+        time.sleep(0.2)
+        furu.StateManager.release_lock(lock_fd, lock_path)
+
+    release_thread = threading.Thread(target=release_later)
+    release_thread.start()
+
+    start = time.time()
+    with compute_lock(
+        directory,
+        backend="local",
+        lease_duration_sec=60.0,
+        heartbeat_interval_sec=10.0,
+        owner={"pid": 12345, "host": "test-host", "user": "test-user"},
+        max_wait_time_sec=60.0,
+        poll_interval_sec=30.0,
+    ) as ctx:
+        assert time.time() - start < 10.0
+        assert ctx.attempt_id is not None
+
+    release_thread.join()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only")
+def test_wait_for_lock_release_wakes_on_release(furu_tmp_root, tmp_path) -> None:
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    lock_path = furu.StateManager.get_lock_path(
+        directory, furu.StateManager.SUBMIT_LOCK
+    )
+    lock_fd = furu.StateManager.try_lock(lock_path)
+    assert lock_fd is not None
+
+    def release_later() -> None:
+        time.sleep(0.1)
+        furu.StateManager.release_lock(lock_fd, lock_path)
+
+    release_thread = threading.Thread(target=release_later)
+    release_thread.start()
+
+    start = time.time()
+    furu.StateManager.wait_for_lock_release(lock_path, 10.0)
+    assert time.time() - start < 5.0
+    assert not lock_path.exists()
+
+    release_thread.join()
+
+
+def test_wait_for_lock_release_polls_without_inotify(
+    furu_tmp_root, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(furu.storage.watch, "_inotify_libc", lambda: None)
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    lock_path = furu.StateManager.get_lock_path(
+        directory, furu.StateManager.SUBMIT_LOCK
+    )
+    lock_fd = furu.StateManager.try_lock(lock_path)
+    assert lock_fd is not None
+
+    def release_later() -> None:
+        time.sleep(0.1)
+        furu.StateManager.release_lock(lock_fd, lock_path)
+
+    release_thread = threading.Thread(target=release_later)
+    release_thread.start()
+
+    start = time.time()
+    furu.StateManager.wait_for_lock_release(lock_path, 10.0)
+    assert time.time() - start < 2.0
+    assert not lock_path.exists()
+
+    release_thread.join()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only")
+def test_wait_for_any_change_wakes_on_any_directory(furu_tmp_root, tmp_path) -> None:
+    directories = [tmp_path / "a", tmp_path / "b", tmp_path / "missing"]
+    for directory in directories[:2]:
+        furu.StateManager.ensure_internal_dir(directory)
+
+    def write_later() -> None:
+        time.sleep(0.1)
+        furu.StateManager.start_attempt_running(
+            directories[1],
+            backend="local",
+            lease_duration_sec=60.0,
+            owner={"pid": os.getpid(), "host": "h", "user": "u"},
+        )
+
+    writer = threading.Thread(target=write_later)
+    writer.start()
+
+    start = time.time()
+    furu.StateManager.wait_for_any_change(directories, 10.0)
+    assert time.time() - start < 5.0
+
+    writer.join()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only")
+def test_wait_for_change_returns_when_condition_already_holds(
+    furu_tmp_root, tmp_path
+) -> None:
+    # A change that lands before the watch is installed produces no event; the
+    # `until` check after installing the watch must catch it.
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    checks: list[bool] = []
+
+    def released() -> bool:
+        checks.append(True)
+        return True
+
+    start = time.time()
+    furu.StateManager.wait_for_change(directory, 10.0, released)
+    assert time.time() - start < 5.0
+    assert checks == [True]
+
+
+def test_compute_lock_uses_reconciled_state_without_rereading(
+    furu_tmp_root, tmp_path, monkeypatch
+) -> None:
+    directory = tmp_path / "obj"
+    furu.StateManager.ensure_internal_dir(directory)
+    attempt_id = furu.StateManager.start_attempt_running(
+        directory,
+        backend="local",
+        lease_duration_sec=60.0,
+        owner={"pid": 99999, "host": "other-host", "user": "other-user"},
+    )
+    furu.StateManager.finish_attempt_success(directory, attempt_id=attempt_id)
+    lock_path = furu.StateManager.get_lock_path(
+        directory, furu.StateManager.COMPUTE_LOCK
+    )
+    lock_fd = furu.StateManager.try_lock(lock_path)
+    assert lock_fd is not None
+
+    read_calls: list[Path] = []
+    original = furu.StateManager.read_state
+
+    def counting_read_state(directory: Path) -> _FuruState:
+        read_calls.append(directory)
+        return original(directory)
+
+    monkeypatch.setattr(
+        furu.StateManager, "read_state", staticmethod(counting_read_state)
+    )
+
+    try:
+        with (
+            pytest.raises(FuruLockNotAcquired, match="already succeeded"),
+            compute_lock(
+                directory,
+                backend="local",
+                lease_duration_sec=60.0,
+                heartbeat_interval_sec=10.0,
+                owner={"pid": 12345, "host": "test-host", "user": "test-user"},
+                max_wait_time_sec=1.0,
+                poll_interval_sec=0.01,
+                reconcile_fn=furu.StateManager.reconcile,
+            ),
+        ):
+            pass
+    finally:
+        furu.StateManager.release_lock(lock_fd, lock_path)
+
+    assert read_calls == []
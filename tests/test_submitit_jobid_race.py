@@ -1,4 +1,5 @@
 import json
+import threading
 import time
 
 import furu
@@ -62,3 +63,160 @@ def test_job_id_watcher_updates_new_attempt(furu_tmp_root) -> None:
     assert attempt is not None
     assert attempt.id == running_id
     assert attempt.scheduler.get("job_id") == "job-123"
+
+
+def test_job_id_watchers_share_one_thread(furu_tmp_root) -> None:
+    adapter = SubmititAdapter(executor=None)
+    jobs: list[FakeJob] = []
+    directories = []
+    for value in range(20):
+        directory = furu_tmp_root / f"task-{value}"
+        furu.StateManager.ensure_internal_dir(directory)
+        furu.StateManager.start_attempt_queued(
+            directory,
+            backend="submitit",
+            lease_duration_sec=furu.FURU_CONFIG.lease_duration_sec,
+            owner={"pid": 99999, "host": "other-host", "user": "x"},
+            scheduler={},
+        )
+        job = FakeJob()
+        adapter.watch_job_id(job, directory, attempt_id="unused")
+        jobs.append(job)
+        directories.append(directory)
+
+    watchers = [t for t in threading.enumerate() if t.name == "furu-job-id-watcher"]
+    assert len(watchers) == 1
+
+    for value, job in enumerate(jobs):
+        job.job_id = f"job-{value}"
+    deadline = time.time() + 5.0
+    while time.time() < deadline:
+        job_ids = [
+            attempt.scheduler.get("job_id")
+            if (attempt := furu.StateManager.read_state(d).attempt) is not None
+            else None
+            for d in directories
+        ]
+        if job_ids == [f"job-{value}" for value in range(len(jobs))]:
+            break
+        time.sleep(0.05)
+
+    assert job_ids == [f"job-{value}" for value in range(len(jobs))]
+
+
+def test_job_id_known_at_submit_is_recorded_immediately(furu_tmp_root) -> None:
+    directory = furu_tmp_root / "task"
+    furu.StateManager.ensure_internal_dir(directory)
+    furu.StateManager.start_attempt_queued(
+        directory,
+        backend="submitit",
+        lease_duration_sec=furu.FURU_CONFIG.lease_duration_sec,
+        owner={"pid": 99999, "host": "other-host", "user": "x"},
+        scheduler={},
+    )
+    job = FakeJob()
+    job.job_id = "job-1"
+    seen: list[str] = []
+
+    SubmititAdapter(executor=None).watch_job_id(
+        job, directory, attempt_id="unused", callback=seen.append
+    )
+
+    attempt = furu.StateManager.read_state(directory).attempt
+    assert attempt is not None
+    assert attempt.scheduler.get("job_id") == "job-1"
+    assert seen == ["job-1"]
+
+
+def test_contended_submit_loads_job_once_pickled(furu_tmp_root) -> None:
+    obj = DummyTask()
+    directory = obj._base_furu_dir()
+    furu.StateManager.ensure_internal_dir(directory)
+    adapter = SubmititAdapter(executor=None)
+    # A pickle left behind by an earlier attempt must not be mistaken for the new one.
+    adapter.pickle_job({"job_id": "old"}, directory)
+    lock_path = furu.StateManager.get_lock_path(
+        directory, furu.StateManager.SUBMIT_LOCK
+    )
+    lock_fd = furu.StateManager.try_lock(lock_path)
+    assert lock_fd is not None
+    pickled = threading.Event()
+    release = threading.Event()
+
+    def finish_submit() -> None:
+        time.sleep(0.1)
+        adapter.pickle_job({"job_id": "123"}, directory)
+        pickled.set()
+        # Keep holding the lock, e.g. while recording the attempt in state.
+        release.wait(5.0)
+        furu.StateManager.release_lock(lock_fd, lock_path)
+
+    submitter = threading.Thread(target=finish_submit)
+    submitter.start()
+
+    start = time.monotonic()
+    job = obj._submit_once(adapter, directory, None, allow_failed=False)
+
+    # Returned on the new pickle, not on the 0.5s bound.
+    assert time.monotonic() - start < 0.4
+    assert pickled.is_set()
+    assert lock_path.exists()
+    release.set()
+    submitter.join()
+    assert job == {"job_id": "123"}
+
+
+def test_contended_submit_gives_up_on_stuck_submitter(furu_tmp_root) -> None:
+    obj = DummyTask()
+    directory = obj._base_furu_dir()
+    furu.StateManager.ensure_internal_dir(directory)
+    lock_path = furu.StateManager.get_lock_path(
+        directory, furu.StateManager.SUBMIT_LOCK
+    )
+    lock_fd = furu.StateManager.try_lock(lock_path)
+    assert lock_fd is not None
+
+    start = time.monotonic()
+    job = obj._submit_once(
+        SubmititAdapter(executor=None), directory, None, allow_failed=False
+    )
+
+    assert job is None
+    assert time.monotonic() - start < 2.0
+    furu.StateManager.release_lock(lock_fd, lock_path)
+
+
+def test_job_id_record_failure_at_submit_is_retried_by_watcher(
+    furu_tmp_root, monkeypatch
+) -> None:
+    directory = furu_tmp_root / "task"
+    furu.StateManager.ensure_internal_dir(directory)
+    furu.StateManager.start_attempt_queued(
+        directory,
+        backend="submitit",
+        lease_duration_sec=furu.FURU_CONFIG.lease_duration_sec,
+        owner={"pid": 99999, "host": "other-host", "user": "x"},
+        scheduler={},
+    )
+    update_state = furu.StateManager.update_state
+    failures = [TimeoutError("state lock busy")]
+
+    def flaky_update_state(directory, mutator):
+        if failures:
+            raise failures.pop()
+        return update_state(directory, mutator)
+
+    monkeypatch.setattr(furu.StateManager, "update_state", flaky_update_state)
+    job = FakeJob()
+    job.job_id = "job-1"
+
+    SubmititAdapter(executor=None).watch_job_id(job, directory, attempt_id="unused")
+
+    deadline = time.time() + 2.0
+    while time.time() < deadline:
+        attempt = furu.StateManager.read_state(directory).attempt
+        if attempt is not None and attempt.scheduler.get("job_id") == "job-1":
+            break
+        time.sleep(0.05)
+    assert attempt is not None
+    assert attempt.scheduler.get("job_id") == "job-1"
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import furu
 
 
@@ -7,3 +9,82 @@ def test_classify_scheduler_state_cancelled(furu_tmp_root, monkeypatch) -> None:
     assert adapter.classify_scheduler_state("CANCELLED") == "preempted"
     monkeypatch.setattr(furu.FURU_CONFIG, "cancelled_is_preempted", False)
     assert adapter.classify_scheduler_state("CANCELLED") == "failed"
+
+
+def test_classify_scheduler_state_exact_and_fallback(furu_tmp_root) -> None:
+    adapter = furu.SubmititAdapter(executor=None)
+    expected = {
+        "COMPLETED": "success",
+        "completing": None,
+        "PREEMPTED": "preempted",
+        "TIMEOUT": "preempted",
+        "NODE_FAIL": "preempted",
+        "REQUEUED": "preempted",
+        "FAILED": "failed",
+        "BOOT_FAIL": "failed",
+        "OUT_OF_MEMORY": None,
+        "RUNNING": None,
+        "PENDING": None,
+        "UNKNOWN ERROR": "failed",
+        # Success wins over failure substrings regardless of position.
+        "ERROR_THEN_COMPLETED": "success",
+        "CANCELLED by 42": None,
+        "": None,
+        None: None,
+    }
+    for state, status in expected.items():
+        assert adapter.classify_scheduler_state(state) == status, state
+
+
+def test_pickle_job_round_trips_without_leftover_temp_files(tmp_path) -> None:
+    adapter = furu.SubmititAdapter(executor=None)
+    adapter.pickle_job({"job_id": "1"}, tmp_path)
+    adapter.pickle_job({"job_id": "2"}, tmp_path)
+
+    assert adapter.load_job(tmp_path) == {"job_id": "2"}
+    internal_dir = furu.StateManager.get_internal_dir(tmp_path)
+    assert [p.name for p in internal_dir.iterdir()] == [adapter.JOB_PICKLE]
+
+
+def test_load_job_unpickles_a_fresh_handle_each_time(tmp_path) -> None:
+    # submitit refreshes scheduler state when a job is unpickled; a reused handle
+    # would report state as old as its watcher's refresh delay.
+    adapter = furu.SubmititAdapter(executor=None)
+    adapter.pickle_job({"job_id": "1"}, tmp_path)
+
+    assert adapter.load_job(tmp_path) is not adapter.load_job(tmp_path)
+
+
+class PropertyStateJob:
+    job_id = "7"
+
+    @property
+    def state(self) -> str:
+        return "OUT_OF_MEMORY"
+
+    def done(self) -> bool:
+        return True
+
+
+class FakeJobAdapter(furu.SubmititAdapter):
+    def __init__(self, jobs: dict[Path, PropertyStateJob]) -> None:
+        super().__init__(executor=None)
+        self.jobs = jobs
+
+    def load_job(self, directory: Path) -> PropertyStateJob | None:
+        return self.jobs.get(directory)
+
+
+def test_get_state_reads_submitit_state_property(tmp_path) -> None:
+    job = PropertyStateJob()
+    adapter = FakeJobAdapter({tmp_path: job})
+
+    assert adapter.get_state(job) == "OUT_OF_MEMORY"
+    assert adapter.get_state(object()) is None
+    assert adapter.is_done(job) is True
+    assert adapter.is_done(object()) is False
+    assert adapter.probe(tmp_path, furu.StateManager.default_state()) == {
+        "terminal_status": "crashed",
+        "scheduler_state": "OUT_OF_MEMORY",
+        "reason": "job_done_unknown_state",
+    }